@@ -7,6 +7,8 @@ for creating professional visualizations with Plotly.
 Note: Chart export functionality requires kaleido (install with: poetry add --group export kaleido)
 """
 
+import importlib
+
 from .colors import (
     BITWISE_COLORS,
     COLOR_HIERARCHY,
@@ -19,26 +21,72 @@ from .colors import (
     OPACITY,
     MARGIN_PRESETS
 )
-from .plotly_theme import register_theme, apply_theme, get_color_palette
-from .formats import format_number, format_percentage, format_currency, format_date
-from .charts import create_bar_chart, create_line_chart, create_scatter_chart, export_chart, save_chart, apply_range_tick_marks
-from .settings import Settings, load_settings, create_env_template
-from .assets import (
-    fetch_crypto_history,
-    fetch_index_history,
-    get_crypto_dataframe,
-    get_index_dataframe,
-    list_available_cryptos,
-    list_available_indices
-)
-# Import fonts module to auto-check font status on import
 from . import fonts
 from .fonts import setup_fonts, install_fonts, check_fonts_installed
 
+# Heavy submodules (plotly, pandas, requests, pydantic) are imported lazily on
+# first attribute access (PEP 562), so `import analystkit` stays fast.
+_LAZY_IMPORTS = {
+    # Theme management
+    "register_theme": "plotly_theme",
+    "apply_theme": "plotly_theme",
+    "get_color_palette": "plotly_theme",
+    
+    # Formatting utilities
+    "format_number": "formats",
+    "format_percentage": "formats",
+    "format_currency": "formats",
+    "format_date": "formats",
+    
+    # Chart helpers
+    "create_bar_chart": "charts",
+    "create_line_chart": "charts",
+    "create_scatter_chart": "charts",
+    "export_chart": "charts",
+    "save_chart": "charts",
+    "apply_range_tick_marks": "charts",
+    
+    # Settings
+    "Settings": "settings",
+    "load_settings": "settings",
+    "reload_settings": "settings",
+    "create_env_template": "settings",
+    
+    # Asset data
+    "fetch_crypto_history": "assets",
+    "fetch_index_history": "assets",
+    "fetch_cryptos": "assets",
+    "fetch_indices": "assets",
+    "get_crypto_dataframe": "assets",
+    "get_index_dataframe": "assets",
+    "list_available_cryptos": "assets",
+    "list_available_indices": "assets",
+    "clear_cache": "assets",
+}
+
+_LAZY_SUBMODULES = {"plotly_theme", "formats", "charts", "settings", "assets"}
+
+def __getattr__(name):
+    """Import lazily exported names and submodules on first access."""
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+        value = getattr(module, name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | _LAZY_SUBMODULES)
+
 __version__ = "0.2.0"
 __author__ = "Josh Carlisle <josh@bitwiseinvestments.com>"
 
-__all__ = [
+__all__ = (
     # Colors and styling
     "BITWISE_COLORS",
     "COLOR_HIERARCHY", 
@@ -73,18 +121,22 @@ __all__ = [
     # Settings
     "Settings",
     "load_settings",
+    "reload_settings",
     "create_env_template",
     
     # Asset data
     "fetch_crypto_history",
     "fetch_index_history", 
+    "fetch_cryptos",
+    "fetch_indices",
     "get_crypto_dataframe",
     "get_index_dataframe",
     "list_available_cryptos",
     "list_available_indices",
+    "clear_cache",
     
     # Font management
     "setup_fonts",
     "install_fonts",
     "check_fonts_installed",
-]
+)
@@ -1,17 +1,271 @@
 """Asset data fetching utilities for crypto and indices."""
 
 import os
+import time
+import hashlib
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import requests
+import numpy as np
 import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from .settings import get_api_key
 
+# Fast JSON parsing for large API responses (optional - install with: pip install orjson)
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 # API Configuration
 BASE_URL = "https://api.bitwiseinvestments.com/"
-API_KEY = get_api_key('bitwise')
+_CRYPTO_URL = BASE_URL + "api/v1/assets/{}/quotes"
+_INDEX_URL = BASE_URL + "api/v1/indexes/{}/history"
+REQUEST_TIMEOUT = (3, 30)  # (connect, read) timeouts in seconds
+MAX_FETCH_WORKERS = 8  # Concurrent requests for multi-symbol fetches
+
+# Common crypto symbols - you can expand this list
+COMMON_CRYPTOS = (
+    'BTC', 'ETH', 'SOL', 'ADA', 'DOT', 'LINK', 'UNI', 'AVAX',
+    'MATIC', 'ATOM', 'LTC', 'BCH', 'XRP', 'DOGE', 'SHIB'
+)
+
+# Common Bitwise indices - you can expand this list
+COMMON_INDICES = (
+    'DEFI', 'BIT10', 'BITW', 'BITQ', 'BITC', 'BITI'
+)
+
+# Shared session so repeated fetches reuse pooled keep-alive connections
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+
+# Response cache configuration (requires diskcache: pip install diskcache)
+CACHE_DIR = os.path.expanduser("~/.analystkit_cache")
+CACHE_EXPIRE = 3600  # Seconds before a cached response is revalidated
+
+_cache = None
+
+def _get_cache():
+    """Get the on-disk response cache, or None if diskcache is not installed."""
+    global _cache
+    if _cache is None:
+        try:
+            from diskcache import Cache
+        except ImportError:
+            return None
+        _cache = Cache(CACHE_DIR)
+    return _cache
+
+def _get_json(url: str, params: Dict[str, str]) -> Any:
+    """Fetch and parse a JSON response, serving repeat requests from the disk cache.
+    
+    Cached responses younger than CACHE_EXPIRE are returned directly. Older ones
+    are revalidated with a conditional GET (If-None-Match / If-Modified-Since),
+    so an unchanged history costs a 304 response instead of a full download.
+    
+    Args:
+        url: Full request URL
+        params: Query parameters for the request
+    
+    Returns:
+        Parsed JSON response
+    """
+    key = hashlib.sha1(repr((url, sorted(params.items()))).encode()).hexdigest()
+    cache = _get_cache()
+    
+    entry = cache.get(key) if cache is not None else None
+    if not isinstance(entry, dict) or 'data' not in entry:
+        entry = None
+    
+    # Return cached response if it is still fresh
+    if entry is not None and time.time() - entry['fetched_at'] < CACHE_EXPIRE:
+        return entry['data']
+    
+    # Revalidate a stale entry instead of re-downloading it
+    headers = {}
+    if entry is not None:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+    
+    response = _session.get(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
+    
+    if response.status_code == 304 and entry is not None:
+        # Not modified - keep the cached data and restart its freshness window
+        data = entry['data']
+    else:
+        response.raise_for_status()
+        data = _json_loads(response.content)
+        entry = {
+            'data': data,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+        }
+    
+    if cache is not None:
+        entry['fetched_at'] = time.time()
+        cache.set(key, entry)
+    
+    return data
+
+def _stream_items(url: str, params: Dict[str, str]) -> Iterator[Any]:
+    """Yield the items of a JSON array response one at a time.
+    
+    Uses ijson to parse the response incrementally when it is installed, so the
+    full list is never held in memory. Falls back to a regular fetch otherwise.
+    """
+    try:
+        import ijson
+    except ImportError:
+        data = _get_json(url, params)
+        if not isinstance(data, list):
+            raise ValueError("Unexpected response format from API")
+        yield from data
+        return
+    
+    with _session.get(url, params=params, timeout=REQUEST_TIMEOUT, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        yield from ijson.items(response.raw, 'item', use_float=True)
+
+def _stream_stats(
+    items: Iterable[Any],
+    extract: Callable[[Any], Optional[Tuple[Any, Any]]],
+    value_prefix: str
+) -> Dict[str, Union[str, int, float, None]]:
+    """Fold count, date range and min/max/last value over items in a single pass.
+    
+    Args:
+        items: Raw API records
+        extract: Function returning (timestamp, value) for a record, or None to skip it
+        value_prefix: Name used for the value statistics (e.g. 'price' -> 'min_price')
+    
+    Returns:
+        Dictionary with data_points plus any available date and value statistics
+    """
+    count = 0
+    first_date = last_date = None
+    min_value = max_value = last_value = None
+    
+    for item in items:
+        point = extract(item)
+        if point is None:
+            continue
+        count += 1
+        timestamp, value = point
+        
+        if timestamp:
+            if first_date is None or timestamp < first_date:
+                first_date = timestamp
+            if last_date is None or timestamp > last_date:
+                last_date = timestamp
+        
+        if value is not None:
+            value = float(value)
+            if value == value:  # Skip NaN
+                if min_value is None or value < min_value:
+                    min_value = value
+                if max_value is None or value > max_value:
+                    max_value = value
+                last_value = value
+    
+    stats = {'data_points': count}
+    if first_date is not None:
+        stats['first_date'] = first_date
+        stats['last_date'] = last_date
+    if last_value is not None:
+        stats[f'min_{value_prefix}'] = min_value
+        stats[f'max_{value_prefix}'] = max_value
+        stats[f'last_{value_prefix}'] = last_value
+    return stats
+
+def _finite_values(values) -> np.ndarray:
+    """Collect numeric values into a float64 array, dropping missing entries."""
+    arr = np.fromiter((np.nan if v is None else v for v in values), dtype=np.float64)
+    return arr[np.isfinite(arr)]
+
+def _snapshot_path(kind: str, symbol: str) -> Path:
+    """Get the Parquet snapshot path for a symbol's DataFrame."""
+    return Path(CACHE_DIR) / f"{kind}_{symbol.upper()}.parquet"
+
+def _snapshot_cache_key(path: Path) -> str:
+    """Response cache key recording when a snapshot was written."""
+    return f"snapshot:{path.name}"
+
+def _read_snapshot(path: Path) -> Optional[pd.DataFrame]:
+    """Read a Parquet snapshot if the response cache says it is younger than CACHE_EXPIRE.
+    
+    Snapshot freshness is recorded in the response cache, so clearing that
+    cache (or running without diskcache) also retires the snapshots.
+    """
+    cache = _get_cache()
+    if cache is None:
+        return None
+    try:
+        written_at = cache.get(_snapshot_cache_key(path))
+        if written_at is not None and time.time() - written_at < CACHE_EXPIRE:
+            return pd.read_parquet(path)
+    except Exception:
+        # Missing file, unreadable snapshot, or no Parquet engine installed;
+        # a snapshot must never break the fetch path
+        pass
+    return None
+
+def _write_snapshot(df: pd.DataFrame, path: Path) -> None:
+    """Write a zstd-compressed Parquet snapshot, skipping silently if unavailable."""
+    cache = _get_cache()
+    if cache is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(path, compression='zstd')
+        cache.set(_snapshot_cache_key(path), time.time())
+    except Exception:
+        # Snapshots are an optimization only (requires pyarrow); pyarrow also
+        # raises ArrowTypeError (a TypeError) for mixed-type object columns
+        pass
+
+def clear_cache() -> None:
+    """
+    Clear cached asset API responses and DataFrame snapshots.
+    
+    The next fetch for any symbol goes to the network again.
+    
+    Example:
+        >>> clear_cache()
+        >>> df = get_crypto_dataframe('btc')  # fetched fresh
+    """
+    cache = _get_cache()
+    if cache is not None:
+        cache.clear()
+    for path in Path(CACHE_DIR).glob("*.parquet"):
+        try:
+            path.unlink()
+        except OSError:
+            pass
 
-def fetch_crypto_history(symbol: str) -> Dict[str, Union[str, int, float, List, None]]:
+def _parse_timestamps(timestamps: pd.Series) -> pd.Series:
+    """Convert API timestamps to UTC datetimes using pandas' vectorized parsers.
+    
+    Epoch values are treated as milliseconds; strings are parsed as ISO 8601,
+    falling back to pandas' per-element format inference for anything else.
+    """
+    if pd.api.types.is_numeric_dtype(timestamps):
+        return pd.to_datetime(timestamps, unit='ms', utc=True)
+    try:
+        return pd.to_datetime(timestamps, format='ISO8601', utc=True, cache=True)
+    except ValueError:
+        return pd.to_datetime(timestamps, utc=True, cache=True)
+
+def fetch_crypto_history(symbol: str, stats_only: bool = False) -> Dict[str, Union[str, int, float, List, None]]:
     """
     Fetch complete price history for a crypto asset.
     
@@ -20,12 +274,15 @@ def fetch_crypto_history(symbol: str) -> Dict[str, Union[str, int, float, List,
     
     Args:
         symbol (str): Crypto symbol (e.g., 'btc', 'ETH', 'sol') - will be auto-capitalized
+        stats_only (bool): If True, stream the response and return only the summary
+                           statistics (no 'results'), keeping memory use constant.
+                           Streaming requires ijson. Defaults to False.
         
     Returns:
         Dict[str, Union[str, int, float, List, None]]: Dictionary containing:
             - symbol (str): The crypto symbol (always uppercase)
             - data_points (int): Number of data points returned
-            - results (List): Raw price data from API
+            - results (List): Raw price data from API (omitted when stats_only=True)
             - first_date (str, optional): Earliest date in dataset
             - last_date (str, optional): Most recent date in dataset
             - min_price (float, optional): Lowest price in dataset
@@ -43,15 +300,20 @@ def fetch_crypto_history(symbol: str) -> Dict[str, Union[str, int, float, List,
         symbol = symbol.upper()
         
         # Set up the endpoint
-        endpoint = f"assets/{symbol}/quotes"
-        url = f"{BASE_URL}api/v1/{endpoint}"
+        url = _CRYPTO_URL.format(symbol)
         
         # Make the API request (no date limits - gets all available data)
-        response = requests.get(url, params={'apiKey': API_KEY})
-        response.raise_for_status()
+        params = {'apiKey': get_api_key('bitwise')}
+        
+        if stats_only:
+            stats = _stream_stats(
+                _stream_items(url, params),
+                lambda item: (item.get('timestamp'), item.get('price')),
+                'price'
+            )
+            return {'symbol': symbol, **stats}
         
-        # Parse the JSON response
-        data = response.json()
+        data = _get_json(url, params)
         
         # Check if data is an array as expected
         if not isinstance(data, list):
@@ -67,8 +329,6 @@ def fetch_crypto_history(symbol: str) -> Dict[str, Union[str, int, float, List,
         # Add statistics if data exists
         if data:
             try:
-                df = pd.DataFrame(data)
-                
                 # Add date range info
                 timestamps = [item.get('timestamp') for item in data if item.get('timestamp')]
                 if timestamps:
@@ -76,10 +336,12 @@ def fetch_crypto_history(symbol: str) -> Dict[str, Union[str, int, float, List,
                     processed_data['last_date'] = max(timestamps)
                 
                 # Add price statistics if price field exists
-                if 'price' in df.columns:
-                    processed_data['min_price'] = float(df['price'].min())
-                    processed_data['max_price'] = float(df['price'].max())
-                    processed_data['last_price'] = float(df['price'].iloc[-1])
+                # (reduced directly over the JSON list - no DataFrame needed)
+                prices = _finite_values(item.get('price') for item in data)
+                if prices.size:
+                    processed_data['min_price'] = float(prices.min())
+                    processed_data['max_price'] = float(prices.max())
+                    processed_data['last_price'] = float(prices[-1])
                     
             except Exception as stats_error:
                 # Continue even if statistics fail
@@ -90,7 +352,18 @@ def fetch_crypto_history(symbol: str) -> Dict[str, Union[str, int, float, List,
     except Exception as e:
         return {"error": f"Error fetching crypto data for {symbol}: {str(e)}"}
 
-def fetch_index_history(symbol: str = 'DEFI') -> Dict[str, Union[str, int, float, List, None]]:
+def _index_record(row: List[Any], symbol: str) -> Dict[str, Any]:
+    """Turn an index history row into a result record.
+    
+    Columns beyond [timestamp, index_value] are kept under their positions
+    (2, 3, ...), as the previous DataFrame-based conversion did.
+    """
+    if len(row) == 2:
+        return {'timestamp': row[0], 'index_value': row[1], 'symbol': symbol}
+    return {'timestamp': row[0], 'index_value': row[1],
+            **dict(enumerate(row[2:], 2)), 'symbol': symbol}
+
+def fetch_index_history(symbol: str = 'DEFI', stats_only: bool = False) -> Dict[str, Union[str, int, float, List, None]]:
     """
     Fetch complete historical data for a Bitwise index.
     
@@ -100,12 +373,16 @@ def fetch_index_history(symbol: str = 'DEFI') -> Dict[str, Union[str, int, float
     Args:
         symbol (str): Index symbol (e.g., 'defi', 'BIT10', 'bitw') - will be auto-capitalized.
                       Defaults to 'DEFI' if not specified.
+        stats_only (bool): If True, stream the response and return only the summary
+                           statistics (no 'results'), keeping memory use constant.
+                           Streaming requires ijson. Defaults to False.
         
     Returns:
         Dict[str, Union[str, int, float, List, None]]: Dictionary containing:
             - symbol (str): The index symbol (always uppercase)
             - data_points (int): Number of data points returned
-            - results (List): Raw index data from API
+            - results (List): Index records with timestamp, index_value and symbol, plus any
+                              extra row columns keyed by position (omitted when stats_only=True)
             - first_date (str, optional): Earliest date in dataset
             - last_date (str, optional): Most recent date in dataset
             - min_value (float, optional): Lowest index value in dataset
@@ -123,72 +400,115 @@ def fetch_index_history(symbol: str = 'DEFI') -> Dict[str, Union[str, int, float
         symbol = symbol.upper()
         
         # Set up the endpoint
-        endpoint = f"indexes/{symbol}/history"
-        url = f"{BASE_URL}api/v1/{endpoint}"
+        url = _INDEX_URL.format(symbol)
         
         # Make the API request (no date limits - gets all available data)
         params = {
             'exclude_backtests': 'true',
-            'apiKey': API_KEY
+            'apiKey': get_api_key('bitwise')
         }
         
-        response = requests.get(url, params=params)
-        response.raise_for_status()
+        if stats_only:
+            stats = _stream_stats(
+                _stream_items(url, params),
+                lambda row: (row[0], row[1]) if len(row) >= 2 else None,
+                'value'
+            )
+            return {'symbol': symbol, **stats}
         
-        # Parse the JSON response
-        data = response.json()
+        data = _get_json(url, params)
         
         # Check if data is an array as expected
         if not isinstance(data, list):
             return {"error": "Unexpected response format from API"}
         
-        # Convert to DataFrame for processing
-        df = pd.DataFrame(data)
-        
-        # Rename columns if data is available
-        if not df.empty and len(df.columns) >= 2:
-            df.rename(columns={0: 'timestamp', 1: 'index_value'}, inplace=True)
-            df['symbol'] = symbol
-            
-            # Convert DataFrame to dict for API response
-            results = df.to_dict(orient='records')
-            
-            processed_data = {
-                'symbol': symbol,
-                'data_points': len(results),
-                'results': results
-            }
-            
-            # Add statistics
-            if results:
-                try:
-                    timestamps = [item.get('timestamp') for item in results if item.get('timestamp')]
-                    if timestamps:
-                        processed_data['first_date'] = min(timestamps)
-                        processed_data['last_date'] = max(timestamps)
-                    
-                    # Add index value statistics
-                    index_values = [item.get('index_value') for item in results if item.get('index_value')]
-                    if index_values:
-                        processed_data['min_value'] = float(min(index_values))
-                        processed_data['max_value'] = float(max(index_values))
-                        processed_data['last_value'] = float(index_values[-1])
-                        
-                except Exception as stats_error:
-                    # Continue even if statistics fail
-                    pass
-            
-            return processed_data
-        else:
+        # Short-circuit empty responses before doing any processing
+        if not data or len(data[0]) < 2:
             return {
                 'symbol': symbol,
                 'data_points': 0,
                 'results': []
             }
+        
+        # Build result records directly from the [timestamp, index_value, ...] rows
+        results = [_index_record(row, symbol) for row in data]
+        
+        processed_data = {
+            'symbol': symbol,
+            'data_points': len(results),
+            'results': results
+        }
+        
+        # Add statistics
+        try:
+            timestamps = [item['timestamp'] for item in results if item['timestamp']]
+            if timestamps:
+                processed_data['first_date'] = min(timestamps)
+                processed_data['last_date'] = max(timestamps)
+            
+            # Add index value statistics
+            index_values = _finite_values(item['index_value'] for item in results)
+            if index_values.size:
+                processed_data['min_value'] = float(index_values.min())
+                processed_data['max_value'] = float(index_values.max())
+                processed_data['last_value'] = float(index_values[-1])
+                
+        except Exception as stats_error:
+            # Continue even if statistics fail
+            pass
+        
+        return processed_data
             
     except Exception as e:
         return {"error": f"Error fetching index data for {symbol}: {str(e)}"}
 
+def _fetch_assets(
+    fetch: Callable[[str], Dict[str, Union[str, int, float, List, None]]],
+    symbols: List[str],
+) -> Dict[str, Dict[str, Union[str, int, float, List, None]]]:
+    """Run fetch for each symbol on a thread pool, keyed by input symbol."""
+    symbols = list(symbols)
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+        return dict(zip(symbols, executor.map(fetch, symbols)))
+
+def fetch_cryptos(symbols: List[str]) -> Dict[str, Dict[str, Union[str, int, float, List, None]]]:
+    """
+    Fetch complete price histories for several crypto assets concurrently.
+    
+    Each symbol is fetched with fetch_crypto_history() on a thread pool, so the
+    network round-trips overlap instead of running one after another.
+    
+    Args:
+        symbols (List[str]): Crypto symbols (e.g., ['btc', 'ETH']) - will be auto-capitalized
+        
+    Returns:
+        Dict[str, Dict]: Mapping of each input symbol to its fetch_crypto_history() result
+        
+    Example:
+        >>> histories = fetch_cryptos(list_available_cryptos())
+        >>> print(f"BTC has {histories['BTC']['data_points']} data points")
+    """
+    return _fetch_assets(fetch_crypto_history, symbols)
+
+def fetch_indices(symbols: List[str]) -> Dict[str, Dict[str, Union[str, int, float, List, None]]]:
+    """
+    Fetch complete historical data for several Bitwise indices concurrently.
+    
+    Each symbol is fetched with fetch_index_history() on a thread pool, so the
+    network round-trips overlap instead of running one after another.
+    
+    Args:
+        symbols (List[str]): Index symbols (e.g., ['defi', 'BIT10']) - will be auto-capitalized
+        
+    Returns:
+        Dict[str, Dict]: Mapping of each input symbol to its fetch_index_history() result
+        
+    Example:
+        >>> histories = fetch_indices(['DEFI', 'BIT10'])
+        >>> print(f"BIT10 has {histories['BIT10']['data_points']} data points")
+    """
+    return _fetch_assets(fetch_index_history, symbols)
+
 def get_crypto_dataframe(symbol: str) -> Optional[pd.DataFrame]:
     """
     Get crypto data as a pandas DataFrame for easy analysis.
@@ -201,7 +521,7 @@ def get_crypto_dataframe(symbol: str) -> Optional[pd.DataFrame]:
         
     Returns:
         Optional[pd.DataFrame]: DataFrame with columns:
-            - timestamp (datetime): Timestamp of the data point
+            - timestamp (datetime): Timestamp of the data point (UTC)
             - price (float): Price at that timestamp
             - Additional columns from API response
             Returns None if error occurs or no data available
@@ -213,6 +533,12 @@ def get_crypto_dataframe(symbol: str) -> Optional[pd.DataFrame]:
         ...     print(f"Date range: {df['timestamp'].min()} to {df['timestamp'].max()}")
         ...     print(f"Price range: ${df['price'].min():.2f} - ${df['price'].max():.2f}")
     """
+    # Reuse a recent local snapshot when available
+    snapshot_path = _snapshot_path('crypto', symbol)
+    df = _read_snapshot(snapshot_path)
+    if df is not None:
+        return df
+    
     data = fetch_crypto_history(symbol)
     
     if 'error' in data:
@@ -223,13 +549,17 @@ def get_crypto_dataframe(symbol: str) -> Optional[pd.DataFrame]:
         print(f"No data available for {symbol}")
         return None
     
-    # Convert to DataFrame
-    df = pd.DataFrame(data['results'])
+    # Convert to DataFrame (columns are the union of all record keys)
+    df = pd.DataFrame.from_records(data['results'])
     
     # Ensure timestamp column exists and convert to datetime
     if 'timestamp' in df.columns:
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df = df.sort_values('timestamp')
+        df['timestamp'] = _parse_timestamps(df['timestamp'])
+        # API data is normally chronological already - only sort when it isn't
+        if not df['timestamp'].is_monotonic_increasing:
+            df = df.sort_values('timestamp', kind='mergesort', ignore_index=True)
+    
+    _write_snapshot(df, snapshot_path)
     
     return df
 
@@ -246,9 +576,10 @@ def get_index_dataframe(symbol: str = 'DEFI') -> Optional[pd.DataFrame]:
         
     Returns:
         Optional[pd.DataFrame]: DataFrame with columns:
-            - timestamp (datetime): Timestamp of the data point
+            - timestamp (datetime): Timestamp of the data point (UTC)
             - index_value (float): Index value at that timestamp
             - symbol (str): The index symbol
+            - Additional columns from API rows, named by position (2, 3, ...)
             Returns None if error occurs or no data available
         
     Example:
@@ -258,6 +589,12 @@ def get_index_dataframe(symbol: str = 'DEFI') -> Optional[pd.DataFrame]:
         ...     print(f"Date range: {df['timestamp'].min()} to {df['timestamp'].max()}")
         ...     print(f"Index range: {df['index_value'].min():.2f} - {df['index_value'].max():.2f}")
     """
+    # Reuse a recent local snapshot when available
+    snapshot_path = _snapshot_path('index', symbol)
+    df = _read_snapshot(snapshot_path)
+    if df is not None:
+        return df
+    
     data = fetch_index_history(symbol)
     
     if 'error' in data:
@@ -268,25 +605,30 @@ def get_index_dataframe(symbol: str = 'DEFI') -> Optional[pd.DataFrame]:
         print(f"No data available for {symbol}")
         return None
     
-    # Convert to DataFrame
-    df = pd.DataFrame(data['results'])
+    # Convert to DataFrame (columns are the union of all record keys)
+    df = pd.DataFrame.from_records(data['results'])
     
     # Ensure timestamp column exists and convert to datetime
     if 'timestamp' in df.columns:
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df = df.sort_values('timestamp')
+        df['timestamp'] = _parse_timestamps(df['timestamp'])
+        # API data is normally chronological already - only sort when it isn't
+        if not df['timestamp'].is_monotonic_increasing:
+            df = df.sort_values('timestamp', kind='mergesort', ignore_index=True)
+    
+    _write_snapshot(df, snapshot_path)
     
     return df
 
-def list_available_cryptos() -> List[str]:
+def list_available_cryptos() -> Tuple[str, ...]:
     """
-    Get a list of available crypto symbols.
+    Get the available crypto symbols.
     
-    Returns a curated list of common cryptocurrency symbols that are typically
-    available through the Bitwise API. This list can be expanded as needed.
+    Returns a curated tuple of common cryptocurrency symbols that are typically
+    available through the Bitwise API. The tuple is a shared module constant,
+    so it is immutable - convert with list() if you need to modify it.
     
     Returns:
-        List[str]: List of available crypto symbols in uppercase
+        Tuple[str, ...]: Available crypto symbols in uppercase
         
     Example:
         >>> cryptos = list_available_cryptos()
@@ -294,22 +636,18 @@ def list_available_cryptos() -> List[str]:
         >>> # Use any symbol with fetch_crypto_history()
         >>> data = fetch_crypto_history(cryptos[0])  # 'BTC'
     """
-    # Common crypto symbols - you can expand this list
-    common_cryptos = [
-        'BTC', 'ETH', 'SOL', 'ADA', 'DOT', 'LINK', 'UNI', 'AVAX',
-        'MATIC', 'ATOM', 'LTC', 'BCH', 'XRP', 'DOGE', 'SHIB'
-    ]
-    return common_cryptos
+    return COMMON_CRYPTOS
 
-def list_available_indices() -> List[str]:
+def list_available_indices() -> Tuple[str, ...]:
     """
-    Get a list of available Bitwise index symbols.
+    Get the available Bitwise index symbols.
     
-    Returns a curated list of Bitwise index symbols that are typically
-    available through the Bitwise API. This list can be expanded as needed.
+    Returns a curated tuple of Bitwise index symbols that are typically
+    available through the Bitwise API. The tuple is a shared module constant,
+    so it is immutable - convert with list() if you need to modify it.
     
     Returns:
-        List[str]: List of available index symbols in uppercase
+        Tuple[str, ...]: Available index symbols in uppercase
         
     Example:
         >>> indices = list_available_indices()
@@ -317,8 +655,4 @@ def list_available_indices() -> List[str]:
         >>> # Use any symbol with fetch_index_history()
         >>> data = fetch_index_history(indices[0])  # 'DEFI'
     """
-    # Common Bitwise indices - you can expand this list
-    common_indices = [
-        'DEFI', 'BIT10', 'BITW', 'BITQ', 'BITC', 'BITI'
-    ]
-    return common_indices
+    return COMMON_INDICES
@@ -1,14 +1,66 @@
 """Common chart wrapper functions for creating styled charts."""
 
+import atexit
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import plotly.graph_objects as go
-import plotly.express as px
 import pandas as pd
 import numpy as np
 from typing import List, Dict, Any, Optional, Union, Callable
 from datetime import datetime, timedelta
-from .plotly_theme import apply_theme, get_color_palette
+from .plotly_theme import apply_theme, _color_palette
 from .colors import SIZE_PRESETS, COLOR_HIERARCHY, OPACITY, MARGIN_PRESETS, FONT_SIZES, FONT_FAMILIES
 
+# Maximum number of concurrent image exports in save_chart
+MAX_EXPORT_WORKERS = 4
+
+# save_chart export dimensions as (width, height) in pixels at 96 DPI
+_ASPECT_RATIOS = {
+    "18:9": (18 * 96, 9 * 96),        # 1728x864
+    "3:1": (18 * 96, 6 * 96),         # 1728x576
+    "1:1": (12 * 96, 12 * 96),        # 1152x1152
+    "type_a": (1275, 900),            # 4.25x3
+    "type_b": (1200, 750),            # 4x2.5
+    "type_c": (1800, 1050),           # 6x3.5
+    "type_d": (1800, 1125),           # 6x3.75
+    "type_e": (825, 975),             # 2.75x3.25
+    "type_f": (825, 900),             # 2.75x3
+}
+
+# export_chart fallback size when neither the call nor the figure sets one
+_DEFAULT_EXPORT_WIDTH = SIZE_PRESETS['full']['width']
+_DEFAULT_EXPORT_HEIGHT = SIZE_PRESETS['full']['height']
+
+# Characters dropped from chart titles when building filenames
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w\- ]+')
+
+def _legend_color(trace) -> Any:
+    """Pick the legend swatch color for a trace.
+    
+    Looks at the marker color (scatter, bar), then the line color (line
+    charts), then the fill color (area charts), falling back to the primary
+    Bitwise green. For per-point color arrays the first entry is used.
+    """
+    for owner, attr in (
+        (getattr(trace, 'marker', None), 'color'),
+        (getattr(trace, 'line', None), 'color'),
+        (trace, 'fillcolor'),
+    ):
+        color = getattr(owner, attr, None)
+        if color is None:
+            continue
+        if isinstance(color, str):
+            if color:
+                return color
+            continue
+        if isinstance(color, (list, tuple, np.ndarray)):
+            if len(color) == 0:
+                continue
+            return color[0] if isinstance(color[0], str) else COLOR_HIERARCHY[1][0]
+        return color
+    return COLOR_HIERARCHY[1][0]  # Default to primary green
+
 def _apply_scatter_legend_markers(fig: go.Figure, marker_size: int = 10) -> go.Figure:
     """Apply scatter circle markers to legend for all traces.
     
@@ -22,72 +74,338 @@ def _apply_scatter_legend_markers(fig: go.Figure, marker_size: int = 10) -> go.F
     Returns:
         Modified figure with scatter markers in legend
     """
-    # Store original traces and their properties
-    traces_to_process = []
+    legend_stubs = []
     
     for trace in fig.data:
         # Only process traces that have names and are shown in legend
-        if trace.name and trace.showlegend is not False:
-            # Extract color from different trace types
-            color = None
-            
-            # Try to get color from marker (for scatter, bar)
-            if hasattr(trace, 'marker') and trace.marker:
-                if isinstance(trace.marker, dict):
-                    color = trace.marker.get('color')
-                elif hasattr(trace.marker, 'color'):
-                    color = trace.marker.color
-            
-            # Try to get color from line (for line charts)
-            if not color and hasattr(trace, 'line') and trace.line:
-                if isinstance(trace.line, dict):
-                    color = trace.line.get('color')
-                elif hasattr(trace.line, 'color'):
-                    color = trace.line.color
-            
-            # Try to get color from fillcolor (for area charts)
-            if not color and hasattr(trace, 'fillcolor'):
-                color = trace.fillcolor
-            
-            # Fallback to default color if none found
-            if not color:
-                color = COLOR_HIERARCHY[1][0]  # Default to primary green
-            
-            # Handle list/array colors (take first if multiple)
-            if isinstance(color, (list, np.ndarray)) and len(color) > 0:
-                color = color[0] if isinstance(color[0], str) else COLOR_HIERARCHY[1][0]
-            
-            traces_to_process.append({
-                'trace': trace,
-                'name': trace.name,
-                'color': color,
-                'legendgroup': getattr(trace, 'legendgroup', trace.name)
-            })
-    
-    # Hide original traces from legend and add scatter markers
-    for trace_info in traces_to_process:
-        trace = trace_info['trace']
+        if not trace.name or trace.showlegend is False:
+            continue
         
-        # Hide original trace from legend
-        trace.showlegend = False
-        
-        # Add invisible scatter trace with marker for legend
-        fig.add_trace(go.Scatter(
+        legend_stubs.append(dict(
+            type='scatter',
             x=[None],
             y=[None],
             mode='markers',
             marker=dict(
                 size=marker_size,
-                color=trace_info['color'],
+                color=_legend_color(trace),
             ),
             showlegend=True,
-            name=trace_info['name'],
-            legendgroup=trace_info['legendgroup'],
+            name=trace.name,
+            legendgroup=trace.legendgroup,
             hoverinfo='skip'
         ))
+        
+        # Hide original trace from legend
+        trace.showlegend = False
+    
+    # Add invisible scatter traces with markers for the legend in one batch
+    if legend_stubs:
+        fig.add_traces(legend_stubs)
     
     return fig
 
+def _apply_axis_labels(fig: go.Figure, x_label: str, y_label: str) -> None:
+    """Set whichever axis titles were given in a single layout update.
+    
+    Titles go to every x/y axis (e.g. facet subplots), as update_xaxes and
+    update_yaxes would set them.
+    """
+    if not (x_label or y_label):
+        return
+    titles = {}
+    for name in fig.layout:
+        if x_label and name.startswith('xaxis'):
+            titles[name] = {'title': {'text': x_label}}
+        elif y_label and name.startswith('yaxis'):
+            titles[name] = {'title': {'text': y_label}}
+    fig.update_layout(titles)
+
+def _numeric_or_list(values: List) -> Union[np.ndarray, List]:
+    """Return values as a numpy array when they are all numeric, else unchanged.
+    
+    Plotly serializes numeric arrays as compact typed buffers rather than
+    element-by-element JSON, so numeric series are handed over as ndarrays.
+    """
+    arr = np.asarray(values)
+    return arr if arr.dtype.kind in 'iuf' else values
+
+def _xy_from_dict(data: Dict) -> tuple:
+    """Split a ``{x: y}`` mapping into x and y values."""
+    return list(data.keys()), _numeric_or_list(list(data.values()))
+
+def _xy_from_list(data: List) -> tuple:
+    """Split a list of ``(x, y)`` pairs, or index a flat list of y values."""
+    if data and isinstance(data[0], (list, tuple)) and len(data[0]) == 2:
+        x_vals, y_vals = zip(*data)
+        return list(x_vals), _numeric_or_list(y_vals)
+    return np.arange(len(data)), _numeric_or_list(data)
+
+# Input type -> x/y builder, looked up by exact type before falling back to isinstance
+_XY_BUILDERS = {
+    dict: _xy_from_dict,
+    list: _xy_from_list,
+}
+
+def _normalize_xy(data: Union[List, Dict]) -> tuple:
+    """Normalize list/dict chart input into ``(x_vals, y_vals)``.
+    
+    Args:
+        data: Dict mapping x to y, list of (x, y) pairs, or flat list of y values
+    
+    Returns:
+        Tuple of (x_vals, y_vals)
+    
+    Raises:
+        ValueError: If data is not a dict or list
+    """
+    builder = _XY_BUILDERS.get(type(data))
+    if builder is None:
+        for kind, candidate in _XY_BUILDERS.items():
+            if isinstance(data, kind):
+                builder = candidate
+                break
+        else:
+            raise ValueError("Data must be DataFrame, dict, or list")
+    return builder(data)
+
+# Point count above which "auto" render mode switches to WebGL (matches Plotly Express)
+_WEBGL_THRESHOLD = 1000
+_RENDER_MODES = ('auto', 'svg', 'webgl')
+
+def _scatter_trace_type(n_points: int, render_mode: str, trace_kwargs: Optional[Dict[str, Any]] = None) -> type:
+    """Choose go.Scattergl or go.Scatter the way Plotly Express does for render_mode.
+    
+    'auto' keeps go.Scatter when the caller passed go.Scatter arguments
+    (trace_kwargs), since go.Scattergl does not accept all of them
+    (e.g. cliponaxis, spline line shapes).
+    """
+    if render_mode not in _RENDER_MODES:
+        raise ValueError(f"Unsupported render_mode: {render_mode}. Supported: {list(_RENDER_MODES)}")
+    if render_mode == 'webgl' or (render_mode == 'auto' and n_points > _WEBGL_THRESHOLD and not trace_kwargs):
+        return go.Scattergl
+    return go.Scatter
+
+def _column_values(column: pd.Series) -> np.ndarray:
+    """Return a DataFrame column as a numpy array suitable for a Plotly trace.
+    
+    Numpy-backed columns come back as zero-copy views. Nullable and
+    Arrow-backed numeric columns (``Int64``, ``double[pyarrow]``, ...) are
+    converted straight to float64 with NaN for missing values, rather
+    than to an object array of boxed scalars.
+    """
+    dtype = column.dtype
+    if (
+        isinstance(dtype, pd.api.extensions.ExtensionDtype)
+        and pd.api.types.is_numeric_dtype(dtype)
+        and not pd.api.types.is_bool_dtype(dtype)
+    ):
+        return column.to_numpy(dtype=np.float64, na_value=np.nan)
+    return column.to_numpy(copy=False)
+
+def _df_trace_kwargs(data: pd.DataFrame, x: str, y: str) -> Dict[str, Any]:
+    """Build single-series trace arguments straight from DataFrame columns.
+    
+    Mirrors what Plotly Express produces for an ungrouped trace (column arrays,
+    hover template, hidden legend entry) without its long-format reshaping.
+    """
+    return dict(
+        x=_column_values(data[x]),
+        y=_column_values(data[y]),
+        hovertemplate=f"{x}=%{{x}}<br>{y}=%{{y}}<extra></extra>",
+        showlegend=False,
+    )
+
+def _is_discrete_column(column: pd.Series) -> bool:
+    """Whether Plotly Express would color by this column with one trace per value.
+    
+    Numeric (and datetime) columns get a continuous color scale in Plotly
+    Express, so those charts keep going through it.
+    """
+    return column.dtype.kind in 'bO'
+
+def _needs_plotly_express(data: pd.DataFrame, x: Any, y: Any,
+                          color_column: Optional[str], kwargs: Dict[str, Any]) -> bool:
+    """Whether a DataFrame chart has to be built with Plotly Express.
+    
+    Traces are only built directly when x, y and color_column name existing
+    columns. Values passed as x/y, unknown column names (which get Plotly
+    Express's descriptive errors), extra Plotly Express arguments and
+    continuous color columns all go through Plotly Express.
+    """
+    if kwargs:
+        return True
+    columns = (x, y, color_column) if color_column else (x, y)
+    if not all(isinstance(column, str) and column in data.columns for column in columns):
+        return True
+    return bool(color_column) and not _is_discrete_column(data[color_column])
+
+def _df_group_traces(trace_type: type, data: pd.DataFrame, x: str, y: str,
+                     color_column: str, **trace_kwargs) -> List[Any]:
+    """Build one trace per color_column value, in order of first appearance.
+    
+    Names, legend groups and hover templates match Plotly Express's grouped
+    output; rows with a missing group value are dropped, as Plotly Express does.
+    """
+    traces = []
+    for value, group in data.groupby(color_column, sort=False, observed=True):
+        name = str(value)
+        traces.append(trace_type(
+            x=_column_values(group[x]),
+            y=_column_values(group[y]),
+            name=name,
+            legendgroup=name,
+            hovertemplate=f"{color_column}={name}<br>{x}=%{{x}}<br>{y}=%{{y}}<extra></extra>",
+            showlegend=True,
+            **trace_kwargs
+        ))
+    return traces
+
+def _uses_continuous_color(fig: go.Figure) -> bool:
+    """Whether Plotly Express colored fig with a continuous scale.
+    
+    A numeric color_column gives a color axis with numeric marker colors;
+    overwriting those with palette colors would flatten the scale.
+    """
+    if fig.layout.coloraxis.to_plotly_json():
+        return True
+    for trace in fig.data:
+        colors = getattr(trace.marker, 'color', None)
+        if colors is not None and not isinstance(colors, str) and np.asarray(colors).dtype.kind in 'iuf':
+            return True
+    return False
+
+def _count_color_groups(fig: go.Figure, data: Any, color_column: str) -> int:
+    """Count the color groups in a grouped chart.
+    
+    Plotly Express emits one legend group per distinct color value, so for
+    DataFrame input the count is read off the figure instead of rescanning
+    the column.
+    """
+    if isinstance(data, pd.DataFrame):
+        return len({trace.legendgroup for trace in fig.data})
+    return len(set(data[color_column]))
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Select ``n_out`` point indices with Largest-Triangle-Three-Buckets.
+    
+    The first and last points are always kept. The points in between are
+    split into ``n_out - 2`` buckets, and from each bucket LTTB keeps the
+    point that forms the largest triangle with the previously kept point
+    and the average of the next bucket. This preserves the visual shape of
+    the series.
+    
+    Missing (NaN) y values never win a bucket that has finite values, and
+    are left out of the bucket averages. A bucket with only missing values
+    keeps one of them, so gaps in a line stay visible.
+    
+    Args:
+        x: Numeric x positions
+        y: Numeric y values
+        n_out: Number of points to keep (at least 3)
+    
+    Returns:
+        Sorted array of selected indices
+    """
+    n = len(y)
+    if n_out >= n:
+        return np.arange(n)
+    
+    finite = np.isfinite(y)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    indices = np.empty(n_out, dtype=np.intp)
+    indices[0] = 0
+    indices[-1] = n - 1
+    
+    # Anchor on the last kept point with a finite value
+    prev = 0
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        bucket_finite = finite[start:end]
+        if not bucket_finite.any():
+            # Only missing values: keep one so the gap survives
+            indices[bucket + 1] = start
+            continue
+        
+        if bucket + 2 < len(edges):
+            next_start, next_end = end, edges[bucket + 2]
+            next_finite = finite[next_start:next_end]
+            if next_finite.any():
+                avg_x = x[next_start:next_end][next_finite].mean()
+                avg_y = y[next_start:next_end][next_finite].mean()
+            else:
+                avg_x = avg_y = np.nan
+        else:
+            avg_x, avg_y = x[n - 1], y[n - 1]
+        
+        if np.isfinite(avg_y) and finite[prev]:
+            areas = np.abs(
+                (x[prev] - avg_x) * (y[start:end] - y[prev])
+                - (x[prev] - x[start:end]) * (avg_y - y[prev])
+            )
+        elif finite[prev]:
+            # Nothing finite to aim at: keep the point farthest from the anchor
+            areas = np.abs(y[start:end] - y[prev])
+        else:
+            areas = np.zeros(end - start)
+        areas = np.where(bucket_finite & np.isfinite(areas), areas, -np.inf)
+        prev = start + int(np.argmax(areas))
+        indices[bucket + 1] = prev
+    
+    return indices
+
+# Per-point trace attributes kept aligned with x/y when decimating
+_PER_POINT_ATTRS = ('text', 'hovertext', 'customdata')
+
+def _numeric_positions(x_vals: np.ndarray) -> np.ndarray:
+    """Map x values to numbers for LTTB: dates to epoch integers, categories to positions."""
+    kind = x_vals.dtype.kind
+    if kind in 'iuf':
+        return x_vals
+    if kind in 'MUSO':
+        # Dates may be datetime64, ISO strings or (tz-aware) Timestamps; utc=True
+        # normalizes offsets without numpy's timezone warning
+        try:
+            return pd.to_datetime(x_vals, format='ISO8601', utc=True).asi8
+        except (TypeError, ValueError):
+            pass
+    return np.arange(len(x_vals))
+
+def _decimate_traces(fig: go.Figure, max_points: int) -> None:
+    """Downsample every trace in fig with more than max_points points (LTTB).
+    
+    Traces with non-numeric y values are left untouched. Non-numeric x
+    values (e.g. categories) are bucketed by position.
+    
+    Raises:
+        ValueError: If max_points is less than 3 (LTTB always keeps the
+                    first and last points)
+    """
+    if max_points < 3:
+        raise ValueError(f"max_points must be at least 3, got {max_points}")
+    
+    for trace in fig.data:
+        if trace.y is None or len(trace.y) <= max_points:
+            continue
+        
+        y_vals = np.asarray(trace.y)
+        if y_vals.dtype.kind not in 'iuf':
+            continue
+        x_vals = np.asarray(trace.x) if trace.x is not None else np.arange(len(y_vals))
+        x_pos = _numeric_positions(x_vals)
+        
+        keep = _lttb_indices(x_pos.astype(np.float64), y_vals.astype(np.float64), max_points)
+        updates = {'x': x_vals[keep], 'y': y_vals[keep]}
+        for attr in _PER_POINT_ATTRS:
+            values = getattr(trace, attr)
+            if values is not None and not isinstance(values, str) and len(values) == len(y_vals):
+                updates[attr] = np.asarray(values)[keep]
+        for attr in ('size', 'color'):
+            values = getattr(trace.marker, attr, None)
+            if values is not None and not isinstance(values, str) and np.ndim(values) == 1 and len(values) == len(y_vals):
+                updates[f'marker_{attr}'] = np.asarray(values)[keep]
+        trace.update(**updates)
+
 def create_bar_chart(
     data: Union[pd.DataFrame, List, Dict],
     x: Optional[str] = None,
@@ -119,39 +437,42 @@ def create_bar_chart(
     """
     if isinstance(data, pd.DataFrame):
         if x and y:
-            if color_column:
-                fig = px.bar(
-                    data, 
-                    x=x, 
-                    y=y, 
-                    color=color_column,
-                    orientation=orientation,
-                    **kwargs
-                )
+            if _needs_plotly_express(data, x, y, color_column, kwargs):
+                # Plotly Express is only needed for customized/continuous-color charts
+                import plotly.express as px
+                if color_column:
+                    fig = px.bar(
+                        data, 
+                        x=x, 
+                        y=y, 
+                        color=color_column,
+                        orientation=orientation,
+                        **kwargs
+                    )
+                else:
+                    fig = px.bar(
+                        data, 
+                        x=x, 
+                        y=y,
+                        orientation=orientation,
+                        **kwargs
+                    )
+            elif color_column:
+                # One bar trace per group, stacked the way Plotly Express stacks them
+                fig = go.Figure(data=_df_group_traces(
+                    go.Bar, data, x, y, color_column, orientation=orientation
+                ))
+                fig.update_layout(barmode='relative', legend_tracegroupgap=0)
             else:
-                fig = px.bar(
-                    data, 
-                    x=x, 
-                    y=y,
-                    orientation=orientation,
-                    **kwargs
-                )
+                # Single series: build the trace directly instead of via px
+                fig = go.Figure(data=[
+                    go.Bar(orientation=orientation, **_df_trace_kwargs(data, x, y))
+                ])
         else:
             raise ValueError("Both x and y must be specified for DataFrame input")
     else:
         # Handle list/dict input
-        if isinstance(data, dict):
-            x_vals = list(data.keys())
-            y_vals = list(data.values())
-        elif isinstance(data, list):
-            if isinstance(data[0], (list, tuple)) and len(data[0]) == 2:
-                x_vals = [item[0] for item in data]
-                y_vals = [item[1] for item in data]
-            else:
-                x_vals = list(range(len(data)))
-                y_vals = data
-        else:
-            raise ValueError("Data must be DataFrame, dict, or list")
+        x_vals, y_vals = _normalize_xy(data)
         
         fig = go.Figure(data=[
             go.Bar(
@@ -162,37 +483,30 @@ def create_bar_chart(
             )
         ])
     
-    # Explicitly hide axis titles by default (before applying theme)
-    fig.update_xaxes(title=None)
-    fig.update_yaxes(title=None)
-    
-    # Apply styling
+    # Apply styling (also hides the axis titles Plotly Express sets by default)
     fig = apply_theme(
         fig, 
         size_preset=size_preset
     )
     
     # Auto-apply Bitwise colors with hierarchy if no custom colors specified
-    if 'color_discrete_sequence' not in kwargs and 'color' not in kwargs:
+    if 'color_discrete_sequence' not in kwargs and 'color' not in kwargs and not _uses_continuous_color(fig):
         if color_column:
-            unique_values = data[color_column].nunique() if hasattr(data, 'nunique') else len(set(data[color_column]))
-            colors = get_color_palette(unique_values)
+            unique_values = _count_color_groups(fig, data, color_column)
+            colors = _color_palette(unique_values)
             # Apply colors individually to each trace
-            for i, trace in enumerate(fig.data):
-                if i < len(colors):
-                    trace.update(marker_color=colors[i])
+            for trace, color in zip(fig.data, colors):
+                trace.marker.color = color
         else:
             # For single series, use primary Bitwise color
-            fig.update_traces(marker_color=COLOR_HIERARCHY[1][0])
+            for trace in fig.data:
+                trace.marker.color = COLOR_HIERARCHY[1][0]
     
     # Apply scatter circle markers to legend (standard for all chart types)
     fig = _apply_scatter_legend_markers(fig, marker_size=10)
     
     # Only update labels if explicitly provided (no defaults)
-    if x_label:
-        fig.update_xaxes(title_text=x_label)
-    if y_label:
-        fig.update_yaxes(title_text=y_label)
+    _apply_axis_labels(fig, x_label, y_label)
     
     return fig
 
@@ -204,6 +518,8 @@ def create_line_chart(
     y_label: str = "",
     color_column: Optional[str] = None,
     size_preset: str = "full",
+    max_points: Optional[int] = None,
+    render_mode: str = "auto",
     **kwargs
 ) -> go.Figure:
     """Create a styled line chart.
@@ -216,6 +532,13 @@ def create_line_chart(
         y_label: Y-axis label
         color_column: Column to use for color grouping
         size_preset: Size preset to use
+        max_points: Downsample each series to at most this many points (at
+                    least 3) with LTTB before plotting (keeps the visual shape
+                    of large series while cutting render time). Default: None
+                    (plot all)
+        render_mode: 'svg', 'webgl', or 'auto' (WebGL above 1000 points, as in
+                     Plotly Express). WebGL draws large series far faster.
+                     For list/dict input, 'auto' stays on SVG when kwargs are given
         **kwargs: Additional arguments passed to go.Scatter
     
     Returns:
@@ -223,40 +546,47 @@ def create_line_chart(
     """
     if isinstance(data, pd.DataFrame):
         if x and y:
-            if color_column:
-                fig = px.line(
-                    data, 
-                    x=x, 
-                    y=y, 
-                    color=color_column,
-                    **kwargs
-                )
+            if _needs_plotly_express(data, x, y, color_column, kwargs):
+                # Plotly Express is only needed for customized/continuous-color charts
+                import plotly.express as px
+                if color_column:
+                    fig = px.line(
+                        data, 
+                        x=x, 
+                        y=y, 
+                        color=color_column,
+                        render_mode=render_mode,
+                        **kwargs
+                    )
+                else:
+                    fig = px.line(
+                        data, 
+                        x=x, 
+                        y=y,
+                        render_mode=render_mode,
+                        **kwargs
+                    )
+            elif color_column:
+                # One line trace per group, as Plotly Express draws them
+                trace_type = _scatter_trace_type(len(data), render_mode)
+                fig = go.Figure(data=_df_group_traces(
+                    trace_type, data, x, y, color_column, mode='lines'
+                ))
+                fig.update_layout(legend_tracegroupgap=0)
             else:
-                fig = px.line(
-                    data, 
-                    x=x, 
-                    y=y,
-                    **kwargs
-                )
+                # Single series: build the trace directly instead of via px
+                fig = go.Figure(data=[
+                    _scatter_trace_type(len(data), render_mode)(mode='lines', **_df_trace_kwargs(data, x, y))
+                ])
         else:
             raise ValueError("Both x and y must be specified for DataFrame input")
     else:
         # Handle list/dict input
-        if isinstance(data, dict):
-            x_vals = list(data.keys())
-            y_vals = list(data.values())
-        elif isinstance(data, list):
-            if isinstance(data[0], (list, tuple)) and len(data[0]) == 2:
-                x_vals = [item[0] for item in data]
-                y_vals = [item[1] for item in data]
-            else:
-                x_vals = list(range(len(data)))
-                y_vals = data
-        else:
-            raise ValueError("Data must be DataFrame, dict, or list")
+        x_vals, y_vals = _normalize_xy(data)
         
+        trace_type = _scatter_trace_type(len(y_vals), render_mode, kwargs)
         fig = go.Figure(data=[
-            go.Scatter(
+            trace_type(
                 x=x_vals,
                 y=y_vals,
                 mode='lines+markers',
@@ -264,44 +594,42 @@ def create_line_chart(
             )
         ])
     
-    # Explicitly hide axis titles by default (before applying theme)
-    fig.update_xaxes(title=None)
-    fig.update_yaxes(title=None)
+    if max_points is not None:
+        _decimate_traces(fig, max_points)
     
-    # Apply styling
+    # Apply styling (also hides the axis titles Plotly Express sets by default)
     fig = apply_theme(
         fig, 
         size_preset=size_preset
     )
     
     # Auto-apply Bitwise colors with hierarchy if no custom colors specified
-    if 'color_discrete_sequence' not in kwargs and 'color' not in kwargs:
+    if 'color_discrete_sequence' not in kwargs and 'color' not in kwargs and not _uses_continuous_color(fig):
         if color_column:
-            unique_values = data[color_column].nunique() if hasattr(data, 'nunique') else len(set(data[color_column]))
-            colors = get_color_palette(unique_values)
+            unique_values = _count_color_groups(fig, data, color_column)
+            colors = _color_palette(unique_values)
             # Apply colors individually to each trace
-            for i, trace in enumerate(fig.data):
-                if i < len(colors):
-                    trace.update(marker_color=colors[i], line_color=colors[i])
+            for trace, color in zip(fig.data, colors):
+                trace.marker.color = color
+                trace.line.color = color
         else:
             # For multiple series without color_column, use color hierarchy
             if len(fig.data) > 1:
-                colors = get_color_palette(len(fig.data))
-                for i, trace in enumerate(fig.data):
-                    if i < len(colors):
-                        trace.update(marker_color=colors[i], line_color=colors[i])
+                colors = _color_palette(len(fig.data))
+                for trace, color in zip(fig.data, colors):
+                    trace.marker.color = color
+                    trace.line.color = color
             else:
                 # For single series, use primary Bitwise color
-                fig.update_traces(marker_color=COLOR_HIERARCHY[1][0], line_color=COLOR_HIERARCHY[1][0])
+                for trace in fig.data:
+                    trace.marker.color = COLOR_HIERARCHY[1][0]
+                    trace.line.color = COLOR_HIERARCHY[1][0]
     
     # Apply scatter circle markers to legend (standard for all chart types)
     fig = _apply_scatter_legend_markers(fig, marker_size=10)
     
     # Only update labels if explicitly provided (no defaults)
-    if x_label:
-        fig.update_xaxes(title_text=x_label)
-    if y_label:
-        fig.update_yaxes(title_text=y_label)
+    _apply_axis_labels(fig, x_label, y_label)
     
     return fig
 
@@ -314,6 +642,8 @@ def create_scatter_chart(
     color_column: Optional[str] = None,
     size_column: Optional[str] = None,
     size_preset: str = "full",
+    max_points: Optional[int] = None,
+    render_mode: str = "auto",
     **kwargs
 ) -> go.Figure:
     """Create a styled scatter chart.
@@ -327,6 +657,13 @@ def create_scatter_chart(
         color_column: Column to use for color grouping
         size_column: Column to use for marker size
         size_preset: Size preset to use
+        max_points: Downsample each series to at most this many points (at
+                    least 3) with LTTB before plotting (keeps the visual shape
+                    of large series while cutting render time). Default: None
+                    (plot all)
+        render_mode: 'svg', 'webgl', or 'auto' (WebGL above 1000 points, as in
+                     Plotly Express). WebGL draws large series far faster.
+                     For list/dict input, 'auto' stays on SVG when kwargs are given
         **kwargs: Additional arguments passed to go.Scatter
     
     Returns:
@@ -334,57 +671,66 @@ def create_scatter_chart(
     """
     if isinstance(data, pd.DataFrame):
         if x and y:
-            if color_column and size_column:
-                fig = px.scatter(
-                    data, 
-                    x=x, 
-                    y=y, 
-                    color=color_column,
-                    size=size_column,
-                    **kwargs
-                )
+            if size_column or _needs_plotly_express(data, x, y, color_column, kwargs):
+                # Plotly Express is only needed for sized/customized/continuous-color charts
+                import plotly.express as px
+                if color_column and size_column:
+                    fig = px.scatter(
+                        data, 
+                        x=x, 
+                        y=y, 
+                        color=color_column,
+                        size=size_column,
+                        render_mode=render_mode,
+                        **kwargs
+                    )
+                elif color_column:
+                    fig = px.scatter(
+                        data, 
+                        x=x, 
+                        y=y, 
+                        color=color_column,
+                        render_mode=render_mode,
+                        **kwargs
+                    )
+                elif size_column:
+                    fig = px.scatter(
+                        data, 
+                        x=x, 
+                        y=y, 
+                        size=size_column,
+                        render_mode=render_mode,
+                        **kwargs
+                    )
+                else:
+                    fig = px.scatter(
+                        data, 
+                        x=x, 
+                        y=y,
+                        render_mode=render_mode,
+                        **kwargs
+                    )
             elif color_column:
-                fig = px.scatter(
-                    data, 
-                    x=x, 
-                    y=y, 
-                    color=color_column,
-                    **kwargs
-                )
-            elif size_column:
-                fig = px.scatter(
-                    data, 
-                    x=x, 
-                    y=y, 
-                    size=size_column,
-                    **kwargs
-                )
+                # One marker trace per group, as Plotly Express draws them
+                trace_type = _scatter_trace_type(len(data), render_mode)
+                fig = go.Figure(data=_df_group_traces(
+                    trace_type, data, x, y, color_column, mode='markers'
+                ))
+                fig.update_layout(legend_tracegroupgap=0)
             else:
-                fig = px.scatter(
-                    data, 
-                    x=x, 
-                    y=y,
-                    **kwargs
-                )
+                # Single series: build the trace directly instead of via px
+                fig = go.Figure(data=[
+                    _scatter_trace_type(len(data), render_mode)(mode='markers', **_df_trace_kwargs(data, x, y))
+                ])
         else:
             raise ValueError("Both x and y must be specified for DataFrame input")
     else:
         # Handle list/dict input
-        if isinstance(data, dict):
-            x_vals = list(data.keys())
-            y_vals = list(data.values())
-        elif isinstance(data, list):
-            if isinstance(data[0], (list, tuple)) and len(data[0]) == 2:
-                x_vals = [item[0] for item in data]
-                y_vals = [item[1] for item in data]
-            else:
-                x_vals = list(range(len(data)))
-                y_vals = data
-        else:
-            raise ValueError("Data must be DataFrame, dict, or list")
+        x_vals, y_vals = _normalize_xy(data)
         
+        trace_type = _scatter_trace_type(len(y_vals), render_mode, kwargs)
         fig = go.Figure(data=[
-            go.Scatter(
+            trace_type(
                 x=x_vals,
                 y=y_vals,
                 mode='markers',
@@ -392,37 +738,39 @@ def create_scatter_chart(
             )
         ])
     
-    # Explicitly hide axis titles by default (before applying theme)
-    fig.update_xaxes(title=None)
-    fig.update_yaxes(title=None)
+    if max_points is not None:
+        _decimate_traces(fig, max_points)
     
-    # Apply styling
+    # Apply styling (also hides the axis titles Plotly Express sets by default)
     fig = apply_theme(
         fig, 
         size_preset=size_preset
     )
     
     # Auto-apply Bitwise colors with hierarchy if no custom colors specified
-    if 'color_discrete_sequence' not in kwargs and 'color' not in kwargs:
+    if 'color_discrete_sequence' not in kwargs and 'color' not in kwargs and not _uses_continuous_color(fig):
         if color_column:
-            unique_values = data[color_column].nunique() if hasattr(data, 'nunique') else len(set(data[color_column]))
-            colors = get_color_palette(unique_values)
+            unique_values = _count_color_groups(fig, data, color_column)
+            colors = _color_palette(unique_values)
             fig.update_traces(marker_color=colors)
         else:
             # For single series, use primary Bitwise color
-            fig.update_traces(marker_color=COLOR_HIERARCHY[1][0])
+            for trace in fig.data:
+                trace.marker.color = COLOR_HIERARCHY[1][0]
     
     # Apply scatter circle markers to legend (standard for all chart types)
     fig = _apply_scatter_legend_markers(fig, marker_size=10)
     
     # Only update labels if explicitly provided (no defaults)
-    if x_label:
-        fig.update_xaxes(title_text=x_label)
-    if y_label:
-        fig.update_yaxes(title_text=y_label)
+    _apply_axis_labels(fig, x_label, y_label)
     
     return fig
 
+# Float dtypes create_heatmap can reduce z data to
+_HEATMAP_DOWNCAST_DTYPES = {
+    'float32': np.float32,
+}
+
 def create_heatmap(
     data: Union[pd.DataFrame, List[List], np.ndarray],
     x_labels: Optional[List] = None,
@@ -431,6 +779,7 @@ def create_heatmap(
     y_label: str = "",
     color_scale: str = "Viridis",
     size_preset: str = "full",
+    downcast: Optional[str] = None,
     **kwargs
 ) -> go.Figure:
     """Create a styled heatmap.
@@ -443,21 +792,35 @@ def create_heatmap(
         y_label: Y-axis label
         color_scale: Color scale to use
         size_preset: Size preset to use
+        downcast: Float dtype to reduce float64 z values to before plotting
+                  ('float32'). Shrinks the figure payload for
+                  large heatmaps; hover values lose precision. Default: None
         **kwargs: Additional arguments passed to go.Heatmap
     
     Returns:
         Styled Plotly figure
     """
+    # Plotly encodes z row by row, so hand it a C-ordered (row-major) array;
+    # DataFrame blocks are frequently column-major
     if isinstance(data, pd.DataFrame):
-        z_data = data.values
-        x_labels = x_labels or list(data.columns)
-        y_labels = y_labels or list(data.index)
+        z_data = np.ascontiguousarray(data.to_numpy(copy=False))
+        if x_labels is None:
+            x_labels = data.columns.to_numpy()
+        if y_labels is None:
+            y_labels = data.index.to_numpy()
     else:
-        z_data = data
+        z_data = np.ascontiguousarray(data)
         if x_labels is None:
-            x_labels = list(range(z_data.shape[1]))
+            x_labels = np.arange(z_data.shape[1])
         if y_labels is None:
-            y_labels = list(range(z_data.shape[0]))
+            y_labels = np.arange(z_data.shape[0])
+    
+    if downcast is not None:
+        if downcast not in _HEATMAP_DOWNCAST_DTYPES:
+            raise ValueError(f"Unsupported downcast: {downcast}. Supported: {list(_HEATMAP_DOWNCAST_DTYPES)}")
+        # Integer data is left alone
+        if z_data.dtype == np.float64:
+            z_data = z_data.astype(_HEATMAP_DOWNCAST_DTYPES[downcast], copy=False)
     
     fig = go.Figure(data=[
         go.Heatmap(
@@ -469,47 +832,62 @@ def create_heatmap(
         )
     ])
     
-    # Explicitly hide axis titles by default (before applying theme)
-    fig.update_xaxes(title=None)
-    fig.update_yaxes(title=None)
-    
-    # Apply styling
+    # Apply styling (also hides the axis titles Plotly Express sets by default)
     fig = apply_theme(
         fig, 
         size_preset=size_preset
     )
     
     # Only update labels if explicitly provided (no defaults)
-    if x_label:
-        fig.update_xaxes(title_text=x_label)
-    if y_label:
-        fig.update_yaxes(title_text=y_label)
+    _apply_axis_labels(fig, x_label, y_label)
     
     return fig
 
-def export_chart(
-    fig: go.Figure, 
-    filename: str, 
-    format: str = "svg",
-    width: Optional[int] = None,
-    height: Optional[int] = None,
-    scale: int = 2
-) -> None:
-    """Export a chart to a file.
+_kaleido_server_lock = threading.Lock()
+_kaleido_server_started = False
+
+def _start_kaleido_server(kaleido) -> None:
+    """Start kaleido's persistent browser once so repeated exports reuse it.
     
-    Args:
-        fig: Plotly figure to export
-        filename: Output filename
-        format: Export format (svg, png, jpg, pdf)
-        width: Export width (uses chart width if None)
-        height: Export height (uses chart height if None)
-        scale: Scale factor for raster formats
+    Kaleido 1.1+ otherwise launches (and tears down) a fresh Chrome process
+    for every write_image call. Older kaleido versions keep their own
+    long-lived process and have no server to start, so this is a no-op there.
+    A started server is shut down again at interpreter exit.
+    """
+    global _kaleido_server_started
+    if _kaleido_server_started:
+        return
+    with _kaleido_server_lock:
+        if _kaleido_server_started:
+            return
+        start_sync_server = getattr(kaleido, 'start_sync_server', None)
+        if start_sync_server is not None:
+            try:
+                start_sync_server(silence_warnings=True)
+            except Exception:
+                # Fall back to kaleido's one-shot rendering; errors such as a
+                # missing Chrome surface from write_image itself
+                pass
+            else:
+                atexit.register(_stop_kaleido_server, kaleido)
+        _kaleido_server_started = True
+
+def _stop_kaleido_server(kaleido) -> None:
+    """Shut down the browser started by _start_kaleido_server."""
+    stop_sync_server = getattr(kaleido, 'stop_sync_server', None)
+    if stop_sync_server is not None:
+        try:
+            stop_sync_server(silence_warnings=True)
+        except Exception:
+            # Nothing useful to report while the interpreter is exiting
+            pass
+
+def _require_kaleido() -> None:
+    """Check that kaleido is importable and start its shared browser.
     
     Raises:
-        ImportError: If kaleido is not installed (required for export)
-        ValueError: If export format is not supported
+        ImportError: If kaleido is not installed
     """
-    # Check if kaleido is available
     try:
         import kaleido
     except ImportError:
@@ -519,11 +897,22 @@ def export_chart(
             "or pip install kaleido"
         )
     
+    _start_kaleido_server(kaleido)
+
+def _write_image(
+    fig: go.Figure,
+    filename: str,
+    format: str,
+    width: Optional[int],
+    height: Optional[int],
+    scale: int
+) -> None:
+    """Write fig to filename; callers check kaleido first with _require_kaleido()."""
     if not filename.endswith(f".{format}"):
         filename = f"{filename}.{format}"
     
-    export_width = width or fig.layout.width or SIZE_PRESETS['full']['width']
-    export_height = height or fig.layout.height or SIZE_PRESETS['full']['height']
+    export_width = width or fig.layout.width or _DEFAULT_EXPORT_WIDTH
+    export_height = height or fig.layout.height or _DEFAULT_EXPORT_HEIGHT
     
     fig.write_image(
         filename,
@@ -532,6 +921,31 @@ def export_chart(
         scale=scale
     )
 
+def export_chart(
+    fig: go.Figure, 
+    filename: str, 
+    format: str = "svg",
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+    scale: int = 2
+) -> None:
+    """Export a chart to a file.
+    
+    Args:
+        fig: Plotly figure to export
+        filename: Output filename
+        format: Export format (svg, png, jpg, pdf)
+        width: Export width (uses chart width if None)
+        height: Export height (uses chart height if None)
+        scale: Scale factor for raster formats
+    
+    Raises:
+        ImportError: If kaleido is not installed (required for export)
+        ValueError: If export format is not supported
+    """
+    _require_kaleido()
+    _write_image(fig, filename, format, width, height, scale)
+
 def save_chart(
     fig: go.Figure,
     title: str,
@@ -561,8 +975,10 @@ def save_chart(
     Returns:
         Dict[str, str]: Dictionary mapping format names to file paths
         
+    If kaleido is not installed, a warning is printed and no files are
+    written (the returned dictionary is empty).
+    
     Raises:
-        ImportError: If kaleido is not installed (required for PNG export)
         ValueError: If aspect_ratio is not supported
         OSError: If output directory cannot be created
     
@@ -578,74 +994,157 @@ def save_chart(
     os.makedirs(output_dir, exist_ok=True)
     
     # Clean title for filename
-    clean_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).rstrip()
-    clean_title = clean_title.replace(' ', '_')
-    
-    # Define aspect ratios and their dimensions (in pixels at 96 DPI)
-    aspect_ratios = {
-        "18:9": {"width": 18 * 96, "height": 9 * 96},  # 1728x864
-        "3:1": {"width": 18 * 96, "height": 6 * 96},   # 1728x576
-        "1:1": {"width": 12 * 96, "height": 12 * 96},  # 1152x1152
-        "type_a": {"width": 1275, "height": 900},      # 4.25x3
-        "type_b": {"width": 1200, "height": 750},      # 4x2.5
-        "type_c": {"width": 1800, "height": 1050},     # 6x3.5
-        "type_d": {"width": 1800, "height": 1125},     # 6x3.75
-        "type_e": {"width": 825, "height": 975},       # 2.75x3.25
-        "type_f": {"width": 825, "height": 900},       # 2.75x3
-    }
+    clean_title = _UNSAFE_FILENAME_CHARS.sub('', title).rstrip().replace(' ', '_')
     
-    if aspect_ratio not in aspect_ratios:
-        raise ValueError(f"Unsupported aspect ratio: {aspect_ratio}. Supported: {list(aspect_ratios.keys())}")
+    if aspect_ratio not in _ASPECT_RATIOS:
+        raise ValueError(f"Unsupported aspect ratio: {aspect_ratio}. Supported: {list(_ASPECT_RATIOS.keys())}")
     
     saved_files = {}
-    dimensions = aspect_ratios[aspect_ratio]
+    dimensions = _ASPECT_RATIOS[aspect_ratio]
     
-    # Export SVG
+    # Collect (key, path, format, (width, height), scale) for each requested export
+    tasks = []
     if include_svg:
-        svg_path = os.path.join(output_dir, f"{clean_title}.svg")
-        try:
-            export_chart(fig, svg_path, format="svg", 
-                        width=dimensions["width"], height=dimensions["height"])
-            saved_files["svg"] = svg_path
-        except ImportError:
-            print("Warning: SVG export failed - kaleido not installed")
-    
-    # Export PNG
+        tasks.append(("svg", os.path.join(output_dir, f"{clean_title}.svg"), "svg", dimensions, 2))
     if include_png:
-        png_path = os.path.join(output_dir, f"{clean_title}.png")
-        try:
-            export_chart(fig, png_path, format="png", 
-                        width=dimensions["width"], height=dimensions["height"], 
-                        scale=png_scale)
-            saved_files["png"] = png_path
-        except ImportError:
-            print("Warning: PNG export failed - kaleido not installed")
+        tasks.append(("png", os.path.join(output_dir, f"{clean_title}.png"), "png", dimensions, png_scale))
     
     # Export 1:1 ratio versions if requested
     if include_1x1:
-        square_dimensions = aspect_ratios["1:1"]
-        
+        square_dimensions = _ASPECT_RATIOS["1:1"]
         if include_svg:
-            svg_1x1_path = os.path.join(output_dir, f"{clean_title}_1x1.svg")
-            try:
-                export_chart(fig, svg_1x1_path, format="svg",
-                            width=square_dimensions["width"], height=square_dimensions["height"])
-                saved_files["svg_1x1"] = svg_1x1_path
-            except ImportError:
-                print("Warning: 1:1 SVG export failed - kaleido not installed")
-        
+            tasks.append(("svg_1x1", os.path.join(output_dir, f"{clean_title}_1x1.svg"),
+                          "svg", square_dimensions, 2))
         if include_png:
-            png_1x1_path = os.path.join(output_dir, f"{clean_title}_1x1.png")
-            try:
-                export_chart(fig, png_1x1_path, format="png",
-                            width=square_dimensions["width"], height=square_dimensions["height"],
-                            scale=png_scale)
-                saved_files["png_1x1"] = png_1x1_path
-            except ImportError:
-                print("Warning: 1:1 PNG export failed - kaleido not installed")
+            tasks.append(("png_1x1", os.path.join(output_dir, f"{clean_title}_1x1.png"),
+                          "png", square_dimensions, png_scale))
+    
+    if not tasks:
+        return saved_files
+    
+    # Check for kaleido once rather than per export
+    try:
+        _require_kaleido()
+    except ImportError:
+        print("Warning: chart export skipped - kaleido not installed")
+        return saved_files
+    
+    def export(task):
+        _, path, fmt, (width, height), scale = task
+        _write_image(fig, path, fmt, width, height, scale)
+    
+    # Run the exports concurrently; kaleido renders out of process, so threads overlap
+    with ThreadPoolExecutor(max_workers=min(MAX_EXPORT_WORKERS, len(tasks))) as executor:
+        list(executor.map(export, tasks))
+    
+    for key, path, *_ in tasks:
+        saved_files[key] = path
     
     return saved_files
 
+def _iso_dates(dates: Union[pd.DatetimeIndex, np.ndarray]) -> List[str]:
+    """Format dates as 'YYYY-MM-DD' strings in one vectorized call."""
+    return np.datetime_as_string(np.asarray(dates, dtype='datetime64[D]'), unit='D').tolist()
+
+def _period_boundary_ticks(
+    starts: pd.DatetimeIndex,
+    ends: pd.DatetimeIndex,
+    midpoints: pd.DatetimeIndex,
+    start_ts: pd.Timestamp,
+    end_ts: pd.Timestamp,
+    include_start_boundary: bool,
+    include_end_boundary: bool,
+    last_end_only: bool = False
+) -> tuple:
+    """Select boundary tick marks and labelled periods for apply_range_tick_marks.
+    
+    A period contributes a start tick if it begins inside the range, an end
+    tick if it ends inside the range, and a label if its midpoint falls in
+    the range. The include_* flags drop the start tick of the first period
+    and the end tick of the last one; with last_end_only (month and week
+    ranges), include_end_boundary=False instead keeps only the last period's
+    end tick.
+    
+    Returns:
+        Tuple of (tick_vals, labelled) where tick_vals lists the boundary
+        dates as 'YYYY-MM-DD' strings (each period's start before its end)
+        and labelled holds the indices of periods to label
+    """
+    if len(starts) == 0:
+        return [], []
+    
+    overlaps = (ends >= start_ts) & (starts <= end_ts)
+    start_ticks = overlaps & (starts >= start_ts)
+    end_ticks = overlaps & (ends <= end_ts)
+    if not include_start_boundary:
+        start_ticks[0] = False
+    if not include_end_boundary:
+        if last_end_only:
+            end_ticks[:-1] = False
+        else:
+            end_ticks[-1] = False
+    labelled = overlaps & (midpoints >= start_ts) & (midpoints <= end_ts)
+    
+    # Interleave each period's start and end, then keep only the selected ticks
+    boundaries = np.column_stack((
+        np.asarray(starts, dtype='datetime64[D]'), np.asarray(ends, dtype='datetime64[D]')
+    )).ravel()
+    selected = np.column_stack((start_ticks, end_ticks)).ravel()
+    
+    return _iso_dates(boundaries[selected]), np.flatnonzero(labelled).tolist()
+
+def _quarter_periods(start_ts: pd.Timestamp, end_ts: pd.Timestamp) -> tuple:
+    """Q1 of the start year through Q4 of the end year, labelled (year, quarter)."""
+    starts = pd.date_range(
+        pd.Timestamp(start_ts.year, 1, 1), pd.Timestamp(end_ts.year, 10, 1), freq='QS'
+    )
+    ends = starts + pd.offsets.QuarterEnd(0)  # Last day of each quarter
+    # Midpoint day of each quarter, in whole-day arithmetic
+    start_days = np.asarray(starts, dtype='datetime64[D]')
+    end_days = np.asarray(ends, dtype='datetime64[D]')
+    midpoints = pd.DatetimeIndex(start_days + (end_days - start_days) // 2)
+    return starts, ends, midpoints, starts.year.tolist(), starts.quarter.tolist()
+
+def _year_periods(start_ts: pd.Timestamp, end_ts: pd.Timestamp) -> tuple:
+    """Calendar years from start to end, labelled at mid-year as (year, year)."""
+    starts = pd.date_range(
+        pd.Timestamp(start_ts.year, 1, 1), pd.Timestamp(end_ts.year, 1, 1), freq='YS'
+    )
+    ends = starts + pd.offsets.YearEnd(0)
+    midpoints = starts + pd.offsets.DateOffset(months=6)  # July 1st
+    years = starts.year.tolist()
+    return starts, ends, midpoints, years, years
+
+def _month_periods(start_ts: pd.Timestamp, end_ts: pd.Timestamp) -> tuple:
+    """Months from start to end, labelled (year, month).
+    
+    The first month keeps start_date's time of day.
+    """
+    month_starts = pd.date_range(start_ts.normalize().replace(day=1), end_ts, freq='MS')
+    starts = month_starts[1:].insert(0, start_ts.replace(day=1)) if len(month_starts) else month_starts
+    ends = month_starts + pd.offsets.MonthEnd(0)
+    midpoints = starts + pd.Timedelta(days=14)  # Approximately day 15
+    return starts, ends, midpoints, starts.year.tolist(), starts.month.tolist()
+
+def _week_periods(start_ts: pd.Timestamp, end_ts: pd.Timestamp) -> tuple:
+    """Monday-to-Sunday weeks from the week containing start, labelled by ISO (year, week)."""
+    starts = pd.date_range(start_ts - pd.Timedelta(days=start_ts.weekday()), end_ts, freq='7D')
+    ends = starts + pd.Timedelta(days=6)  # Sunday
+    midpoints = starts + pd.Timedelta(days=3)  # Thursday
+    iso = midpoints.isocalendar()
+    return starts, ends, midpoints, iso['year'].tolist(), iso['week'].tolist()
+
+# apply_range_tick_marks margins for unset sides; 'b' is also the minimum bottom margin
+_RANGE_TICK_MARGIN = {'l': 40, 'r': 40, 't': 60, 'b': 70}
+
+# Period type -> (period builder, last_end_only flag for _period_boundary_ticks)
+_RANGE_PERIODS = {
+    'quarter': (_quarter_periods, False),
+    'year': (_year_periods, False),
+    'month': (_month_periods, True),
+    'week': (_week_periods, True),
+}
+
 def apply_range_tick_marks(
     fig: go.Figure,
     start_date: Union[str, pd.Timestamp, datetime],
@@ -709,6 +1208,9 @@ def apply_range_tick_marks(
         ...     label_formatter=lambda year, _: f"{year}"
         ... )
     """
+    if period not in _RANGE_PERIODS:
+        raise ValueError(f"Unsupported period type: {period}. Supported: {', '.join(repr(p) for p in _RANGE_PERIODS)}")
+    
     # Convert dates to Timestamps
     start_ts = pd.Timestamp(start_date)
     end_ts = pd.Timestamp(end_date)
@@ -732,193 +1234,30 @@ def apply_range_tick_marks(
     if label_font_family is None:
         label_font_family = FONT_FAMILIES['primary']
     
-    tick_vals = []  # Boundary positions (for tick marks)
-    label_annotations = []  # Labels at midpoints (via annotations)
+    # Properties shared by every midpoint label
+    label_base = {
+        'y': label_y_position,
+        'showarrow': False,
+        'xref': 'x',
+        'yref': 'paper',
+        'xanchor': 'center',
+        'yanchor': 'top',
+        'font': {'size': label_font_size, 'family': label_font_family},
+    }
     
     # Generate periods based on type
-    if period == "quarter":
-        # Q1 2023 through Q4 of end year
-        start_year = start_ts.year
-        end_year = end_ts.year
-        
-        for year in range(start_year, end_year + 1):
-            for quarter in range(1, 5):
-                # Quarter boundaries
-                quarter_start_month = (quarter - 1) * 3 + 1
-                quarter_end_month = quarter_start_month + 2
-                
-                # Calculate quarter start date (first day of quarter)
-                quarter_start = pd.Timestamp(f'{year}-{quarter_start_month:02d}-01')
-                
-                # Calculate quarter end date (last day of quarter)
-                if quarter_end_month == 12:
-                    quarter_end = pd.Timestamp(f'{year}-12-31')
-                else:
-                    # Get last day of the month
-                    next_month = quarter_end_month + 1
-                    if next_month > 12:
-                        next_month = 1
-                        next_year = year + 1
-                    else:
-                        next_year = year
-                    quarter_end = pd.Timestamp(f'{next_year}-{next_month:02d}-01') - pd.Timedelta(days=1)
-                
-                # Calculate quarter midpoint (for label)
-                days_in_quarter = (quarter_end - quarter_start).days
-                quarter_midpoint = quarter_start + pd.Timedelta(days=days_in_quarter // 2)
-                
-                # Only add if period overlaps with our data range
-                if quarter_end >= start_ts and quarter_start <= end_ts:
-                    # Add start boundary tick
-                    if quarter_start >= start_ts and (include_start_boundary or year != start_year or quarter != 1):
-                        tick_vals.append(quarter_start.strftime('%Y-%m-%d'))
-                    
-                    # Add midpoint label as annotation
-                    if quarter_midpoint >= start_ts and quarter_midpoint <= end_ts:
-                        label_annotations.append(dict(
-                            x=quarter_midpoint.strftime('%Y-%m-%d'),
-                            y=label_y_position,
-                            text=label_formatter(year, quarter),
-                            showarrow=False,
-                            xref='x',
-                            yref='paper',
-                            xanchor='center',
-                            yanchor='top',
-                            font=dict(size=label_font_size, family=label_font_family)
-                        ))
-                    
-                    # Add end boundary tick (only if not last quarter of last year, or if include_end_boundary is True)
-                    if quarter_end <= end_ts:
-                        if not (year == end_year and quarter == 4) or include_end_boundary:
-                            tick_vals.append(quarter_end.strftime('%Y-%m-%d'))
-    
-    elif period == "year":
-        # Years from start to end
-        start_year = start_ts.year
-        end_year = end_ts.year
-        
-        for year in range(start_year, end_year + 1):
-            year_start = pd.Timestamp(f'{year}-01-01')
-            year_end = pd.Timestamp(f'{year}-12-31')
-            
-            # Calculate year midpoint
-            year_midpoint = pd.Timestamp(f'{year}-07-01')  # Mid-year
-            
-            # Only add if year overlaps with data range
-            if year_end >= start_ts and year_start <= end_ts:
-                # Add start boundary tick
-                if year_start >= start_ts and (include_start_boundary or year != start_year):
-                    tick_vals.append(year_start.strftime('%Y-%m-%d'))
-                
-                # Add midpoint label
-                if year_midpoint >= start_ts and year_midpoint <= end_ts:
-                    label_annotations.append(dict(
-                        x=year_midpoint.strftime('%Y-%m-%d'),
-                        y=label_y_position,
-                        text=label_formatter(year, year),
-                        showarrow=False,
-                        xref='x',
-                        yref='paper',
-                        xanchor='center',
-                        yanchor='top',
-                        font=dict(size=label_font_size, family=label_font_family)
-                    ))
-                
-                # Add end boundary tick
-                if year_end <= end_ts and (include_end_boundary or year != end_year):
-                    tick_vals.append(year_end.strftime('%Y-%m-%d'))
-    
-    elif period == "month":
-        # Months from start to end
-        current = start_ts.replace(day=1)  # Start of first month
-        
-        while current <= end_ts:
-            # Month boundaries
-            month_start = current
-            if current.month == 12:
-                month_end = pd.Timestamp(current.year, 12, 31)
-                next_month = pd.Timestamp(current.year + 1, 1, 1)
-            else:
-                month_end = pd.Timestamp(current.year, current.month + 1, 1) - pd.Timedelta(days=1)
-                next_month = pd.Timestamp(current.year, current.month + 1, 1)
-            
-            # Calculate month midpoint (approximately day 15)
-            month_midpoint = month_start + pd.Timedelta(days=14)
-            
-            # Only add if month overlaps with data range
-            if month_end >= start_ts and month_start <= end_ts:
-                # Add start boundary tick
-                if month_start >= start_ts and (include_start_boundary or current != start_ts.replace(day=1)):
-                    tick_vals.append(month_start.strftime('%Y-%m-%d'))
-                
-                # Add midpoint label
-                if month_midpoint >= start_ts and month_midpoint <= end_ts:
-                    label_annotations.append(dict(
-                        x=month_midpoint.strftime('%Y-%m-%d'),
-                        y=label_y_position,
-                        text=label_formatter(current.year, current.month),
-                        showarrow=False,
-                        xref='x',
-                        yref='paper',
-                        xanchor='center',
-                        yanchor='top',
-                        font=dict(size=label_font_size, family=label_font_family)
-                    ))
-                
-                # Add end boundary tick
-                if month_end <= end_ts and (include_end_boundary or next_month > end_ts):
-                    tick_vals.append(month_end.strftime('%Y-%m-%d'))
-            
-            current = next_month
-    
-    elif period == "week":
-        # Weeks from start to end (Monday to Sunday)
-        # Find the Monday of the week containing start_date
-        current = start_ts
-        # Get to Monday (weekday 0 = Monday)
-        days_since_monday = current.weekday()
-        week_start = current - pd.Timedelta(days=days_since_monday)
-        
-        week_num = 1
-        while week_start <= end_ts:
-            # Week boundaries (Monday to Sunday)
-            week_end = week_start + pd.Timedelta(days=6)  # Sunday
-            
-            # Calculate week midpoint (Thursday)
-            week_midpoint = week_start + pd.Timedelta(days=3)
-            
-            # Only add if week overlaps with data range
-            if week_end >= start_ts and week_start <= end_ts:
-                # Add start boundary tick (Monday)
-                if week_start >= start_ts and (include_start_boundary or week_start != start_ts - pd.Timedelta(days=start_ts.weekday())):
-                    tick_vals.append(week_start.strftime('%Y-%m-%d'))
-                
-                # Add midpoint label (Thursday)
-                if week_midpoint >= start_ts and week_midpoint <= end_ts:
-                    # Calculate ISO week number for the year
-                    iso_year, iso_week, _ = week_midpoint.isocalendar()
-                    label_annotations.append(dict(
-                        x=week_midpoint.strftime('%Y-%m-%d'),
-                        y=label_y_position,
-                        text=label_formatter(iso_year, iso_week),
-                        showarrow=False,
-                        xref='x',
-                        yref='paper',
-                        xanchor='center',
-                        yanchor='top',
-                        font=dict(size=label_font_size, family=label_font_family)
-                    ))
-                
-                # Add end boundary tick (Sunday)
-                if week_end <= end_ts and (include_end_boundary or week_start + pd.Timedelta(days=7) > end_ts):
-                    tick_vals.append(week_end.strftime('%Y-%m-%d'))
-            
-            # Move to next week (next Monday)
-            week_start = week_start + pd.Timedelta(days=7)
-            week_num += 1
+    build_periods, last_end_only = _RANGE_PERIODS[period]
+    starts, ends, midpoints, years, period_nums = build_periods(start_ts, end_ts)
     
-    else:
-        raise ValueError(f"Unsupported period type: {period}. Supported: 'quarter', 'year', 'month', 'week'")
+    tick_vals, labelled = _period_boundary_ticks(
+        starts, ends, midpoints, start_ts, end_ts,
+        include_start_boundary, include_end_boundary, last_end_only
+    )
+    midpoint_strs = _iso_dates(midpoints[labelled])
+    label_annotations = [
+        {**label_base, 'x': x, 'text': label_formatter(years[i], period_nums[i])}
+        for x, i in zip(midpoint_strs, labelled)
+    ]
     
     # Update x-axis with tick marks at boundaries, empty labels
     xaxis_dict = dict(
@@ -927,7 +1266,7 @@ def apply_range_tick_marks(
         tickvals=tick_vals,
         ticktext=[''] * len(tick_vals),  # Empty labels for all tick marks
         tickangle=0,
-        range=[start_ts.strftime('%Y-%m-%d'), end_ts.strftime('%Y-%m-%d')],
+        range=[start_ts.date().isoformat(), end_ts.date().isoformat()],
         ticks='outside',
         ticklen=ticklen,
         tickwidth=1,
@@ -937,22 +1276,15 @@ def apply_range_tick_marks(
     # Merge any additional kwargs
     xaxis_dict.update(kwargs)
     
-    # Update layout
-    fig.update_layout(**{f"{xaxis_id}axis": xaxis_dict})
-    
     # Increase bottom margin to accommodate labels (if not already set)
-    current_margin = fig.layout.margin or {}
-    if isinstance(current_margin, dict):
-        bottom_margin = current_margin.get('b', 70)
-        fig.update_layout(margin=dict(
-            b=max(bottom_margin, 70),  # Ensure at least 70px for labels
-            l=current_margin.get('l', 40),
-            r=current_margin.get('r', 40),
-            t=current_margin.get('t', 60)
-        ))
+    margin = {**_RANGE_TICK_MARGIN, **fig.layout.margin.to_plotly_json()}
+    margin['b'] = max(margin['b'], _RANGE_TICK_MARGIN['b'])  # Ensure at least 70px for labels
+    
+    # Update axis and margin in one layout pass
+    fig.update_layout(**{f"{xaxis_id}axis": xaxis_dict, 'margin': margin})
     
-    # Add annotations for labels AFTER layout is set
-    for annotation in label_annotations:
-        fig.add_annotation(**annotation)
+    # Add annotations for labels AFTER layout is set, appending them in one assignment
+    if label_annotations:
+        fig.layout.annotations = fig.layout.annotations + tuple(label_annotations)
     
     return fig
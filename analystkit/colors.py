@@ -1,7 +1,13 @@
 """Style guide constants for charts and visualizations."""
 
+from types import MappingProxyType
+
+# Palettes are tuples and the top-level tables are read-only mappings: themes
+# and palettes built from them are cached, so they must not change at runtime.
+# Copy a table (e.g. dict(SIZE_PRESETS)) to customize it.
+
 # Color palettes
-BITWISE_COLORS = [
+BITWISE_COLORS = (
     '#45b979',  # Green
     '#a7d8b5',  # Light green
     '#006472',  # Dark teal
@@ -13,22 +19,22 @@ BITWISE_COLORS = [
     '#00b6c9',  # Turquoise
     '#91d6e0',  # Light turquoise
     '#f05b72',  # Red
-]
+)
 
 # Color hierarchy for different numbers of items
-COLOR_HIERARCHY = {
-    1: ['#45b979'],  # Green
-    2: ['#45b979', '#6c6b71'],  # Green, Dark grey
-    3: ['#45b979', '#006472', '#6c6b71'],  # Green, Dark teal, Dark grey
-    4: ['#45b979', '#a7d8b5', '#006472', '#6c6b71'],  # Green, Light green, Dark teal, Dark grey
-    5: ['#45b979', '#a7d8b5', '#006472', '#62a0ad', '#6c6b71'],  # Green, Light green, Dark teal, Light teal, Dark grey
-    6: ['#45b979', '#a7d8b5', '#006472', '#62a0ad', '#6c6b71', '#b7b6b9'],  # Green, Light green, Dark teal, Light teal, Dark grey, Light grey
-    7: ['#45b979', '#a7d8b5', '#006472', '#62a0ad', '#6c6b71', '#b7b6b9', '#4f2984'],  # Green, Light green, Dark teal, Light teal, Dark grey, Light grey, Purple
-    8: ['#45b979', '#a7d8b5', '#006472', '#62a0ad', '#6c6b71', '#b7b6b9', '#4f2984', '#927fb5'],  # Green, Light green, Dark teal, Light teal, Dark grey, Light grey, Purple, Light purple
-    9: ['#45b979', '#a7d8b5', '#006472', '#62a0ad', '#6c6b71', '#b7b6b9', '#4f2984', '#927fb5', '#00b6c9'],  # Green, Light green, Dark teal, Light teal, Dark grey, Light grey, Purple, Light purple, Turquoise
-    10: ['#45b979', '#a7d8b5', '#006472', '#62a0ad', '#6c6b71', '#b7b6b9', '#4f2984', '#927fb5', '#00b6c9', '#91d6e0'],  # Green, Light green, Dark teal, Light teal, Dark grey, Light grey, Purple, Light purple, Turquoise, Light turquoise
-    11: ['#45b979', '#a7d8b5', '#006472', '#62a0ad', '#6c6b71', '#b7b6b9', '#4f2984', '#927fb5', '#00b6c9', '#91d6e0', '#f05b72'],  # Green, Light green, Dark teal, Light teal, Dark grey, Light grey, Purple, Light purple, Turquoise, Light turquoise, Red
-}
+COLOR_HIERARCHY = MappingProxyType({
+    1: ('#45b979',),  # Green
+    2: ('#45b979', '#6c6b71'),  # Green, Dark grey
+    3: ('#45b979', '#006472', '#6c6b71'),  # Green, Dark teal, Dark grey
+    4: ('#45b979', '#a7d8b5', '#006472', '#6c6b71'),  # Green, Light green, Dark teal, Dark grey
+    5: ('#45b979', '#a7d8b5', '#006472', '#62a0ad', '#6c6b71'),  # Green, Light green, Dark teal, Light teal, Dark grey
+    6: ('#45b979', '#a7d8b5', '#006472', '#62a0ad', '#6c6b71', '#b7b6b9'),  # Green, Light green, Dark teal, Light teal, Dark grey, Light grey
+    7: ('#45b979', '#a7d8b5', '#006472', '#62a0ad', '#6c6b71', '#b7b6b9', '#4f2984'),  # Green, Light green, Dark teal, Light teal, Dark grey, Light grey, Purple
+    8: ('#45b979', '#a7d8b5', '#006472', '#62a0ad', '#6c6b71', '#b7b6b9', '#4f2984', '#927fb5'),  # Green, Light green, Dark teal, Light teal, Dark grey, Light grey, Purple, Light purple
+    9: ('#45b979', '#a7d8b5', '#006472', '#62a0ad', '#6c6b71', '#b7b6b9', '#4f2984', '#927fb5', '#00b6c9'),  # Green, Light green, Dark teal, Light teal, Dark grey, Light grey, Purple, Light purple, Turquoise
+    10: ('#45b979', '#a7d8b5', '#006472', '#62a0ad', '#6c6b71', '#b7b6b9', '#4f2984', '#927fb5', '#00b6c9', '#91d6e0'),  # Green, Light green, Dark teal, Light teal, Dark grey, Light grey, Purple, Light purple, Turquoise, Light turquoise
+    11: ('#45b979', '#a7d8b5', '#006472', '#62a0ad', '#6c6b71', '#b7b6b9', '#4f2984', '#927fb5', '#00b6c9', '#91d6e0', '#f05b72'),  # Green, Light green, Dark teal, Light teal, Dark grey, Light grey, Purple, Light purple, Turquoise, Light turquoise, Red
+})
 
 CHART_COLORS = {
     'background': '#ffffff',
@@ -61,7 +67,7 @@ OPACITY = {
 }
 
 # Style defaults
-STYLE_DEFAULTS = {
+STYLE_DEFAULTS = MappingProxyType({
     'font': {
         'family': FONT_FAMILIES['primary'],  # PPNeueMontreal-Regular for all text except title
         'size': FONT_SIZES['axis'],
@@ -132,10 +138,10 @@ STYLE_DEFAULTS = {
             'color': CHART_COLORS['text'],
         },
     },
-}
+})
 
 # Margin presets
-MARGIN_PRESETS = {
+MARGIN_PRESETS = MappingProxyType({
     'minimal': {
         'l': 20,
         'r': 20,
@@ -154,10 +160,10 @@ MARGIN_PRESETS = {
         't': 60,
         'b': 60,
     },
-}
+})
 
 # Size presets
-SIZE_PRESETS = {
+SIZE_PRESETS = MappingProxyType({
     'full': {
         'width': 1200,
         'height': 800,
@@ -202,7 +208,7 @@ SIZE_PRESETS = {
         'width': 825,   # 2.75x3
         'height': 900,
     },
-}
+})
 
 EXPORT_CONFIG = {
     'format': 'svg',
@@ -1,10 +1,30 @@
 """Font loading and registration utilities for custom fonts."""
 
+import functools
 import os
 import sys
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Directory scan results keyed by (directory, scan function name); an entry is
+# reused while the directory's modification time is unchanged
+_scan_cache: Dict[Tuple[Path, str], Tuple[int, Any]] = {}
+
+def _cached_scan(directory: Path, scan: Callable[[Path], Any]) -> Any:
+    """Return scan(directory), rescanning only when the directory's mtime changes.
+    
+    Raises:
+        OSError: If the directory cannot be accessed
+    """
+    mtime = directory.stat().st_mtime_ns
+    key = (directory, scan.__name__)
+    cached = _scan_cache.get(key)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, scan(directory))
+        _scan_cache[key] = cached
+    return cached[1]
 
 def get_fonts_directory() -> Path:
     """Get the path to the fonts directory in the package."""
@@ -30,26 +50,70 @@ def get_system_fonts_directory() -> Optional[Path]:
     else:
         return None
 
+# File extensions recognized as fonts in the package fonts directory
+_FONT_EXTENSIONS = frozenset({'.otf', '.ttf', '.ttc', '.woff', '.woff2'})
+
+# Upper bound on threads copying fonts in install_fonts
+_MAX_FONT_WORKERS = 8
+
+def _scan_package_fonts(fonts_dir: Path) -> Tuple[Path, ...]:
+    """Scan fonts_dir for font files, sorted by path."""
+    with os.scandir(fonts_dir) as entries:
+        fonts = [Path(entry.path) for entry in entries
+                 if os.path.splitext(entry.name)[1].lower() in _FONT_EXTENSIONS
+                 and entry.is_file()]
+    return tuple(sorted(fonts))
+
 def list_package_fonts() -> List[Path]:
     """List all font files in the package fonts directory."""
-    fonts_dir = get_fonts_directory()
-    if not fonts_dir.exists():
+    try:
+        return list(_cached_scan(get_fonts_directory(), _scan_package_fonts))
+    except OSError:
+        # Fonts directory missing or unreadable
         return []
-    
-    font_extensions = {'.otf', '.ttf', '.ttc', '.woff', '.woff2'}
-    fonts = [f for f in fonts_dir.iterdir() 
-             if f.is_file() and f.suffix.lower() in font_extensions]
-    return sorted(fonts)
+
+def _scan_entry_names(directory: Path) -> Tuple[str, ...]:
+    """List the names in directory that a '*' glob would match (no dotfiles)."""
+    with os.scandir(directory) as entries:
+        return tuple(entry.name for entry in entries if not entry.name.startswith('.'))
 
 def is_font_installed(font_name: str) -> bool:
-    """Check if a font is installed in the system."""
+    """Check if a font is installed in the system.
+    
+    The directory listing is reused until the system fonts directory changes.
+    """
     system_fonts_dir = get_system_fonts_directory()
-    if not system_fonts_dir or not system_fonts_dir.exists():
+    if not system_fonts_dir:
+        return False
+    
+    try:
+        entry_names = _cached_scan(system_fonts_dir, _scan_entry_names)
+    except OSError:
+        # System fonts directory missing or unreadable
         return False
     
     # Check if font file exists in system fonts directory
-    font_files = list(system_fonts_dir.glob(f'*{font_name}*'))
-    return len(font_files) > 0
+    return any(font_name in name for name in entry_names)
+
+def invalidate_cache() -> None:
+    """Forget cached font lookups so the next check reads the filesystem again."""
+    _scan_cache.clear()
+
+def _install_font(font_path: Path, system_fonts_dir: Path, force: bool) -> Tuple[str, str]:
+    """Copy one font into system_fonts_dir; returns (results key, entry)."""
+    font_name = font_path.name
+    dest_path = system_fonts_dir / font_name
+    
+    # Check if already installed
+    if dest_path.exists() and not force:
+        return 'skipped', font_name
+    
+    try:
+        # Copy font to system fonts directory
+        shutil.copy2(font_path, dest_path)
+        return 'installed', font_name
+    except Exception as e:
+        return 'failed', f'{font_name}: {str(e)}'
 
 def install_fonts(force: bool = False) -> dict:
     """
@@ -81,21 +145,15 @@ def install_fonts(force: bool = False) -> dict:
         'failed': []
     }
     
-    for font_path in package_fonts:
-        font_name = font_path.name
-        dest_path = system_fonts_dir / font_name
-        
-        # Check if already installed
-        if dest_path.exists() and not force:
-            results['skipped'].append(font_name)
-            continue
-        
-        try:
-            # Copy font to system fonts directory
-            shutil.copy2(font_path, dest_path)
-            results['installed'].append(font_name)
-        except Exception as e:
-            results['failed'].append(f'{font_name}: {str(e)}')
+    # Copies are I/O bound, so overlap them; map() keeps results in font order
+    if package_fonts:
+        install_one = functools.partial(_install_font, system_fonts_dir=system_fonts_dir, force=force)
+        with ThreadPoolExecutor(max_workers=min(_MAX_FONT_WORKERS, len(package_fonts))) as executor:
+            for status, entry in executor.map(install_one, package_fonts):
+                results[status].append(entry)
+    
+    if results['installed']:
+        invalidate_cache()
     
     return results
 
@@ -159,16 +217,3 @@ def setup_fonts(auto_install: bool = False) -> dict:
                                       for info in font_status.values())
     
     return result
-
-# Auto-setup fonts on import (non-blocking, just checks status)
-def _auto_setup():
-    """Automatically check font status on import."""
-    try:
-        setup_fonts(auto_install=False)
-    except Exception:
-        # Silently fail - fonts might not be critical for basic functionality
-        pass
-
-# Run auto-setup when module is imported
-_auto_setup()
-
@@ -1,9 +1,50 @@
 """Number and date formatting utilities."""
 
+import bisect
+import functools
 import locale
+import threading
+from types import MappingProxyType
 from typing import Union, Optional
 from datetime import datetime, date
 
+@functools.lru_cache(maxsize=32)
+def _separator_table(thousands_sep: str, decimal_sep: str) -> dict:
+    """Translation table mapping Python's ',' and '.' to the given separators."""
+    return str.maketrans({",": thousands_sep, ".": decimal_sep})
+
+# (threshold, suffix) pairs, smallest first; each threshold is also the divisor
+_ABBREVIATIONS = ((1000, "K"), (1000000, "M"), (1000000000, "B"), (1000000000000, "T"))
+_ABBREVIATION_THRESHOLDS = tuple(threshold for threshold, _ in _ABBREVIATIONS)
+
+def _format_grouped(
+    value: Union[int, float],
+    decimals: int,
+    prefix: str,
+    suffix: str,
+    separators: Optional[dict] = None
+) -> str:
+    """Shared core of format_number and format_percentage.
+    
+    Formats abs(value) with Python's "," grouping (truncating when decimals
+    is 0), applies the optional separator translation table, then adds the
+    prefix, suffix and a leading "-" for negative values.
+    """
+    abs_value = abs(value)
+    if decimals == 0:
+        formatted = f"{int(abs_value):,}"
+    else:
+        formatted = f"{abs_value:,.{decimals}f}"
+    if separators is not None:
+        formatted = formatted.translate(separators)
+    
+    # Add prefix, suffix, and sign
+    result = f"{prefix}{formatted}{suffix}"
+    if value < 0:
+        result = f"-{result}"
+    
+    return result
+
 def format_number(
     value: Union[int, float], 
     decimals: int = 0, 
@@ -28,30 +69,8 @@ def format_number(
     if value is None:
         return ""
     
-    # Handle negative numbers
-    is_negative = value < 0
-    abs_value = abs(value)
-    
-    # Format the number
-    if decimals == 0:
-        formatted = f"{int(abs_value):,}".replace(",", thousands_sep)
-    else:
-        formatted = f"{abs_value:.{decimals}f}".replace(",", thousands_sep)
-        if decimal_sep != ".":
-            formatted = formatted.replace(".", decimal_sep)
-    
-    # Add separators
-    if thousands_sep:
-        parts = formatted.split(decimal_sep if decimal_sep != "." else ".")[0]
-        if len(parts) > 3:
-            formatted = formatted.replace(parts, f"{int(parts):,}".replace(",", thousands_sep))
-    
-    # Add prefix, suffix, and sign
-    result = f"{prefix}{formatted}{suffix}"
-    if is_negative:
-        result = f"-{result}"
-    
-    return result
+    return _format_grouped(value, decimals, prefix, suffix,
+                           _separator_table(thousands_sep, decimal_sep))
 
 def format_percentage(
     value: Union[int, float], 
@@ -78,7 +97,20 @@ def format_percentage(
     if multiply_by_100:
         value = value * 100
     
-    return format_number(value, decimals, prefix=prefix, suffix=suffix)
+    # Default separators, so no separator translation is needed
+    return _format_grouped(value, decimals, prefix, suffix)
+
+# Currency symbols
+_CURRENCY_SYMBOLS = MappingProxyType({
+    "USD": "$",
+    "EUR": "€",
+    "GBP": "£",
+    "JPY": "¥",
+    "CAD": "C$",
+    "AUD": "A$",
+    "CHF": "CHF",
+    "CNY": "¥",
+})
 
 def format_currency(
     value: Union[int, float], 
@@ -102,19 +134,7 @@ def format_currency(
     if value is None:
         return ""
     
-    # Currency symbols
-    currency_symbols = {
-        "USD": "$",
-        "EUR": "€",
-        "GBP": "£",
-        "JPY": "¥",
-        "CAD": "C$",
-        "AUD": "A$",
-        "CHF": "CHF",
-        "CNY": "¥",
-    }
-    
-    symbol = currency_symbols.get(currency, currency)
+    symbol = _CURRENCY_SYMBOLS.get(currency, currency)
     
     return format_number(
         value, 
@@ -124,6 +144,29 @@ def format_currency(
         prefix=symbol
     )
 
+# LC_TIME is process-wide; localized formatting holds this lock while it is switched
+_LOCALE_LOCK = threading.Lock()
+
+def _strftime(date_obj, format_str: str) -> str:
+    """strftime, falling back to str() for values that cannot be formatted."""
+    try:
+        return date_obj.strftime(format_str)
+    except (AttributeError, ValueError):
+        return str(date_obj)
+
+# Date string formats tried, in order, by format_date
+_DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%Y-%m-%d %H:%M:%S")
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> Optional[datetime]:
+    """Parse a date string with the first matching format, or None if none match."""
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    return None
+
 def format_date(
     date_obj: Union[datetime, date, str], 
     format_str: str = "%Y-%m-%d",
@@ -144,30 +187,28 @@ def format_date(
     
     # Convert string to datetime if needed
     if isinstance(date_obj, str):
-        try:
-            # Try common date formats
-            for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%Y-%m-%d %H:%M:%S"]:
-                try:
-                    date_obj = datetime.strptime(date_obj, fmt)
-                    break
-                except ValueError:
-                    continue
-            else:
-                raise ValueError(f"Could not parse date string: {date_obj}")
-        except ValueError:
-            return str(date_obj)
+        # Tables repeat the same date strings, so parsed values are cached
+        parsed = _parse_date(date_obj)
+        if parsed is None:
+            return date_obj
+        date_obj = parsed
+    
+    if not locale_name:
+        return _strftime(date_obj, format_str)
     
-    # Set locale if specified
-    if locale_name:
+    # Switch LC_TIME only for this call and restore the previous locale afterwards
+    with _LOCALE_LOCK:
+        previous = locale.setlocale(locale.LC_TIME)
+        if previous == locale_name:
+            return _strftime(date_obj, format_str)
         try:
             locale.setlocale(locale.LC_TIME, locale_name)
         except locale.Error:
-            pass  # Fall back to default locale
-    
-    try:
-        return date_obj.strftime(format_str)
-    except (AttributeError, ValueError):
-        return str(date_obj)
+            return _strftime(date_obj, format_str)  # Fall back to current locale
+        try:
+            return _strftime(date_obj, format_str)
+        finally:
+            locale.setlocale(locale.LC_TIME, previous)
 
 def format_abbreviated_number(value: Union[int, float], decimals: int = 1) -> str:
     """Format large numbers with abbreviations (K, M, B, T).
@@ -182,16 +223,11 @@ def format_abbreviated_number(value: Union[int, float], decimals: int = 1) -> st
     if value is None:
         return ""
     
-    if abs(value) < 1000:
+    index = bisect.bisect_right(_ABBREVIATION_THRESHOLDS, abs(value))
+    if index == 0:
         return format_number(value, decimals=0)
-    elif abs(value) < 1000000:
-        return f"{value/1000:.{decimals}f}K"
-    elif abs(value) < 1000000000:
-        return f"{value/1000000:.{decimals}f}M"
-    elif abs(value) < 1000000000000:
-        return f"{value/1000000000:.{decimals}f}B"
-    else:
-        return f"{value/1000000000000:.{decimals}f}T"
+    divisor, suffix = _ABBREVIATIONS[index - 1]
+    return f"{value/divisor:.{decimals}f}{suffix}"
 
 def format_duration(seconds: Union[int, float], format_type: str = "auto") -> str:
     """Format duration in seconds to human-readable format.
@@ -1,32 +1,24 @@
 """Plotly theme management and registration."""
 
+import functools
+import itertools
 import plotly.graph_objects as go
-import plotly.express as px
 import numpy as np
-from .colors import STYLE_DEFAULTS, CHART_COLORS, SIZE_PRESETS, MARGIN_PRESETS
+from .colors import (
+    STYLE_DEFAULTS, CHART_COLORS, SIZE_PRESETS, MARGIN_PRESETS,
+    COLOR_HIERARCHY, BITWISE_COLORS,
+)
 
-def _calculate_axis_buffer(values):
+def _calculate_axis_buffer(data_min, data_max):
     """Calculate axis range with a dynamic buffer to ensure max values are visible.
     
     Args:
-        values: List or array of numeric values
+        data_min: Smallest finite value on the axis
+        data_max: Largest finite value on the axis
     
     Returns:
-        tuple: (min, max) with buffer applied, or None if no valid data
+        tuple: (min, max) with buffer applied
     """
-    if not values:
-        return None
-    
-    # Convert to numpy array and filter out invalid values
-    data = np.array(values)
-    data = data[np.isfinite(data)]
-    
-    if len(data) == 0:
-        return None
-    
-    data_min = float(np.min(data))
-    data_max = float(np.max(data))
-    
     # Calculate range
     data_range = data_max - data_min
     
@@ -45,6 +37,41 @@ def _calculate_axis_buffer(values):
     
     return (data_min_final, data_max_buffered)
 
+def _axis_extrema(traces, axis):
+    """Min and max of the finite numeric values in the traces' ``axis`` data.
+    
+    Each trace is reduced in NumPy; only the per-trace extrema are combined.
+    Traces with non-numeric data (category labels, dates) are skipped.
+    
+    Args:
+        traces: Figure traces
+        axis: Trace attribute holding the values ('x' or 'y')
+    
+    Returns:
+        tuple: (min, max), or None if no valid data
+    """
+    mins = []
+    maxs = []
+    for trace in traces:
+        values = getattr(trace, axis, None)
+        if values is not None:
+            data = np.asarray(values)
+            if data.dtype.kind == 'O':
+                try:
+                    data = data.astype(float)  # None gaps become NaN
+                except (TypeError, ValueError):
+                    continue
+            elif data.dtype.kind not in 'biuf':
+                continue
+            data = data[np.isfinite(data)]
+            if data.size:
+                mins.append(float(data.min()))
+                maxs.append(float(data.max()))
+    
+    if not mins:
+        return None
+    return (min(mins), max(maxs))
+
 def _apply_axis_buffers(fig):
     """Apply buffers to value axis to ensure max values are visible.
     
@@ -54,47 +81,26 @@ def _apply_axis_buffers(fig):
         fig: Plotly figure object
     """
     # Check if this is a horizontal bar chart by looking at orientation
-    is_horizontal_bar = False
-    for trace in fig.data:
-        # Check if it's a bar trace with horizontal orientation
-        if (hasattr(trace, 'type') and trace.type == 'bar' and 
-            hasattr(trace, 'orientation') and trace.orientation == 'h'):
-            is_horizontal_bar = True
-            break
+    is_horizontal_bar = any(
+        getattr(trace, 'type', None) == 'bar' and getattr(trace, 'orientation', None) == 'h'
+        for trace in fig.data
+    )
     
     if is_horizontal_bar:
         # For horizontal bars, buffer the x-axis (which has the values)
-        x_values = []
-        for trace in fig.data:
-            if hasattr(trace, 'x') and trace.x is not None:
-                x_data = np.array(trace.x)
-                x_data = x_data[np.isfinite(x_data)]
-                if len(x_data) > 0:
-                    x_values.extend(x_data.tolist())
-        
-        x_range = _calculate_axis_buffer(x_values)
-        if x_range is not None:
-            x_min, x_max = x_range
-            fig.update_xaxes(range=[x_min, x_max])
+        x_extrema = _axis_extrema(fig.data, 'x')
+        if x_extrema is not None:
+            fig.update_xaxes(range=list(_calculate_axis_buffer(*x_extrema)))
     else:
         # For vertical charts (bars, lines, scatter), buffer the y-axis (which has the values)
-        y_values = []
-        for trace in fig.data:
-            if hasattr(trace, 'y') and trace.y is not None:
-                y_data = np.array(trace.y)
-                y_data = y_data[np.isfinite(y_data)]
-                if len(y_data) > 0:
-                    y_values.extend(y_data.tolist())
-        
-        y_range = _calculate_axis_buffer(y_values)
-        if y_range is not None:
-            y_min, y_max = y_range
-            fig.update_yaxes(range=[y_min, y_max])
+        y_extrema = _axis_extrema(fig.data, 'y')
+        if y_extrema is not None:
+            fig.update_yaxes(range=list(_calculate_axis_buffer(*y_extrema)))
 
-def register_theme():
-    """Register the custom theme with Plotly."""
-    # Create the custom theme layout
-    custom_layout = {
+@functools.lru_cache(maxsize=None)
+def _custom_layout():
+    """Build the registered theme layout once; register_theme() hands out copies."""
+    return {
         'plot_bgcolor': CHART_COLORS['background'],
         'paper_bgcolor': CHART_COLORS['background'],
         'font': STYLE_DEFAULTS['font'],
@@ -110,29 +116,51 @@ def register_theme():
         },
         'legend': STYLE_DEFAULTS['legend'],
     }
+
+def register_theme():
+    """Register the custom theme with Plotly.
     
+    The layout is built on the first call; later calls reuse it, so calling
+    this from several scripts is cheap.
+    """
     # Register the theme (simplified for newer Plotly versions)
     # Note: Template registration has changed in newer Plotly versions
     # For now, we'll just return the custom layout
     print("Theme registered successfully. Use apply_theme() to apply styling to individual charts.")
     
-    return custom_layout
+    # Fresh top-level and axis dicts per call, as before, so callers can edit them
+    layout = _custom_layout()
+    return {**layout, 'xaxis': dict(layout['xaxis']), 'yaxis': dict(layout['yaxis'])}
 
-def apply_theme(fig, size_preset='full', margin_preset='minimal'):
-    """Apply the custom theme to a Plotly figure.
-    
-    Args:
-        fig: Plotly figure object
-        size_preset: Size preset to use ('full', 'half', '18:9', '3:1', '1:1')
-        margin_preset: Margin preset to use ('minimal', 'standard', 'wide')
-    
-    Returns:
-        Updated figure object
-    """
-    # Apply size preset
+# Specific x-axis styling (no grid, no titles)
+# All fonts use PPNeueMontreal-Regular (via STYLE_DEFAULTS['font'])
+_XAXIS_STYLE = dict(
+    showgrid=STYLE_DEFAULTS['xaxis']['showgrid'],
+    zeroline=STYLE_DEFAULTS['xaxis']['zeroline'],
+    showline=STYLE_DEFAULTS['xaxis']['showline'],
+    title=None,  # Explicitly hide x-axis title by default
+    tickfont=STYLE_DEFAULTS['font'],  # PPNeueMontreal-Regular
+)
+
+# Specific y-axis styling (horizontal grid lines, no titles)
+_YAXIS_STYLE = dict(
+    showgrid=STYLE_DEFAULTS['yaxis']['showgrid'],
+    gridwidth=STYLE_DEFAULTS['yaxis']['gridwidth'],
+    gridcolor=STYLE_DEFAULTS['yaxis']['gridcolor'],
+    zeroline=STYLE_DEFAULTS['yaxis']['zeroline'],
+    zerolinewidth=STYLE_DEFAULTS['yaxis']['zerolinewidth'],
+    zerolinecolor=STYLE_DEFAULTS['yaxis']['zerolinecolor'],
+    showline=STYLE_DEFAULTS['yaxis']['showline'],
+    title=None,  # Explicitly hide y-axis title by default
+    tickfont=STYLE_DEFAULTS['font'],  # PPNeueMontreal-Regular
+)
+
+@functools.lru_cache(maxsize=None)
+def _theme_layout(size_preset, margin_preset):
+    """Build the figure-level theme properties once per size/margin preset pair."""
     size = SIZE_PRESETS.get(size_preset, SIZE_PRESETS['full'])
     margin = MARGIN_PRESETS.get(margin_preset, MARGIN_PRESETS['minimal'])
-    fig.update_layout(
+    return dict(
         width=size['width'],
         height=size['height'],
         plot_bgcolor=CHART_COLORS['background'],
@@ -140,44 +168,45 @@ def apply_theme(fig, size_preset='full', margin_preset='minimal'):
         font=STYLE_DEFAULTS['font'],  # PPNeueMontreal-Regular for all text (default)
         title_font=STYLE_DEFAULTS['title_font'],  # Items-Regular for chart titles only
         margin=margin,
+        # Legend styling (no border, clean look)
+        # Legend font uses PPNeueMontreal-Regular (via STYLE_DEFAULTS['legend']['font'])
+        legend=STYLE_DEFAULTS['legend'],
     )
+
+def apply_theme(fig, size_preset='full', margin_preset='minimal'):
+    """Apply the custom theme to a Plotly figure.
     
-    # Apply specific x-axis styling (no grid, no titles)
-    # All fonts use PPNeueMontreal-Regular (via STYLE_DEFAULTS['font'])
-    fig.update_xaxes(
-        showgrid=STYLE_DEFAULTS['xaxis']['showgrid'],
-        zeroline=STYLE_DEFAULTS['xaxis']['zeroline'],
-        showline=STYLE_DEFAULTS['xaxis']['showline'],
-        title=None,  # Explicitly hide x-axis title by default
-        tickfont=STYLE_DEFAULTS['font'],  # PPNeueMontreal-Regular
-    )
+    Args:
+        fig: Plotly figure object
+        size_preset: Size preset to use ('full', 'half', '18:9', '3:1', '1:1')
+        margin_preset: Margin preset to use ('minimal', 'standard', 'wide')
     
-    # Apply specific y-axis styling (horizontal grid lines, no titles)
-    # All fonts use PPNeueMontreal-Regular (via STYLE_DEFAULTS['font'])
-    fig.update_yaxes(
-        showgrid=STYLE_DEFAULTS['yaxis']['showgrid'],
-        gridwidth=STYLE_DEFAULTS['yaxis']['gridwidth'],
-        gridcolor=STYLE_DEFAULTS['yaxis']['gridcolor'],
-        zeroline=STYLE_DEFAULTS['yaxis']['zeroline'],
-        zerolinewidth=STYLE_DEFAULTS['yaxis']['zerolinewidth'],
-        zerolinecolor=STYLE_DEFAULTS['yaxis']['zerolinecolor'],
-        showline=STYLE_DEFAULTS['yaxis']['showline'],
-        title=None,  # Explicitly hide y-axis title by default
-        tickfont=STYLE_DEFAULTS['font'],  # PPNeueMontreal-Regular
-    )
+    Returns:
+        Updated figure object
+    """
+    # One layout update; the axis styles go to every x/y axis, as update_xaxes/update_yaxes would
+    layout_update = dict(_theme_layout(size_preset, margin_preset))
+    for name in fig.layout:
+        if name.startswith('xaxis'):
+            layout_update[name] = _XAXIS_STYLE
+        elif name.startswith('yaxis'):
+            layout_update[name] = _YAXIS_STYLE
+    fig.update_layout(layout_update)
     
     # Apply axis buffer to ensure max values are visible
     # Handles both vertical (y-axis) and horizontal (x-axis) charts
     _apply_axis_buffers(fig)
     
-    # Apply legend styling (no border, clean look)
-    # Legend font uses PPNeueMontreal-Regular (via STYLE_DEFAULTS['legend']['font'])
-    fig.update_layout(
-        legend=STYLE_DEFAULTS['legend']
-    )
-    
     return fig
 
+@functools.lru_cache(maxsize=64)
+def _color_palette(n_colors):
+    """Build the palette for ``n_colors`` once; returned as an immutable tuple."""
+    if n_colors <= 6:
+        return tuple(COLOR_HIERARCHY.get(n_colors, BITWISE_COLORS[:n_colors]))
+    # For more than 6 colors, cycle through the base palette
+    return tuple(itertools.islice(itertools.cycle(BITWISE_COLORS), n_colors))
+
 def get_color_palette(n_colors):
     """Get a color palette for the specified number of colors.
     
@@ -187,11 +216,4 @@ def get_color_palette(n_colors):
     Returns:
         List of hex color codes
     """
-    from .colors import COLOR_HIERARCHY, BITWISE_COLORS
-    
-    if n_colors <= 6:
-        return COLOR_HIERARCHY.get(n_colors, BITWISE_COLORS[:n_colors])
-    else:
-        # For more than 6 colors, cycle through the base palette
-        import itertools
-        return list(itertools.islice(itertools.cycle(BITWISE_COLORS), n_colors))
+    return list(_color_palette(n_colors))
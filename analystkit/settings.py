@@ -47,6 +47,29 @@ class Settings(BaseSettings):
         case_sensitive = False
         extra = "allow"  # Allow extra fields from environment
 
+# (service, field name) for each documented *_api_key field; fields are fixed at class definition
+_API_KEY_FIELDS = tuple(
+    (field_name.replace('_api_key', ''), field_name)
+    for field_name, field in Settings.model_fields.items()
+    if field_name.endswith('_api_key') and field.description
+)
+
+# .env files already loaded, mapped to their mtime when read
+_dotenv_mtimes: Dict[str, int] = {}
+
+def _load_dotenv_once(env_file: str) -> None:
+    """Load an .env file unless it was already loaded and has not changed since."""
+    try:
+        mtime = os.stat(env_file).st_mtime_ns
+    except OSError:
+        load_dotenv(env_file)
+        return
+    
+    path = os.path.abspath(env_file)
+    if _dotenv_mtimes.get(path) != mtime:
+        load_dotenv(env_file)
+        _dotenv_mtimes[path] = mtime
+
 def load_settings(env_file: Optional[str] = None) -> Settings:
     """Load settings from environment variables and .env file.
     
@@ -57,10 +80,23 @@ def load_settings(env_file: Optional[str] = None) -> Settings:
         Settings instance
     """
     if env_file:
-        load_dotenv(env_file)
+        _load_dotenv_once(env_file)
     
     return Settings()
 
+def reload_settings(env_file: Optional[str] = None) -> Settings:
+    """Reload the global settings instance, e.g. after the environment changed.
+    
+    Args:
+        env_file: Optional path to .env file
+    
+    Returns:
+        The new global Settings instance
+    """
+    global settings
+    settings = load_settings(env_file)
+    return settings
+
 def get_setting(key: str, default: Any = None) -> Any:
     """Get a setting value by key.
     
@@ -71,7 +107,6 @@ def get_setting(key: str, default: Any = None) -> Any:
     Returns:
         Setting value or default
     """
-    settings = load_settings()
     return getattr(settings, key, default)
 
 def set_setting(key: str, value: Any) -> None:
@@ -82,6 +117,7 @@ def set_setting(key: str, value: Any) -> None:
         value: Setting value
     """
     os.environ[key.upper()] = str(value)
+    reload_settings()
 
 def get_api_key(service: str) -> Optional[str]:
     """Get API key for a specific service.
@@ -92,7 +128,6 @@ def get_api_key(service: str) -> Optional[str]:
     Returns:
         API key if found, None otherwise
     """
-    settings = load_settings()
     key_name = f"{service}_api_key"
     
     if hasattr(settings, key_name):
@@ -108,16 +143,8 @@ def validate_api_keys() -> Dict[str, bool]:
     Returns:
         Dictionary mapping service names to validation status
     """
-    settings = load_settings()
-    validation_results = {}
-    
-    # Check for API keys in settings
-    for field_name, field in settings.__fields__.items():
-        if field_name.endswith('_api_key') and field.description:
-            key_value = getattr(settings, field_name)
-            validation_results[field_name.replace('_api_key', '')] = bool(key_value)
-    
-    return validation_results
+    return {service: bool(getattr(settings, field_name))
+            for service, field_name in _API_KEY_FIELDS}
 
 def create_env_template(output_path: str = ".env.template") -> None:
     """Create a template .env file with all available settings.
@@ -146,5 +173,5 @@ def create_env_template(output_path: str = ".env.template") -> None:
     
     print(f"Environment template created at: {output_path}")
 
-# Global settings instance
+# Global settings instance, shared by the getters below; refresh with reload_settings()
 settings = load_settings()